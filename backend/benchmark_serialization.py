@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Search Response Serialization Benchmark
+Compares the previous /search response path (hand-built dicts, pydantic
+response_model validation, jsonable_encoder, stdlib json) with the fast
+path (row mapper + FastJSONResponse) on synthetic rows.
+"""
+
+import argparse
+import datetime
+import decimal
+import logging
+import statistics
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+logging.disable(logging.CRITICAL)  # importing the API logs service start-up
+
+from consultant_api import ConsultantSearchResponse, RESULT_COLUMNS, map_result_row
+from serialization import FastJSONResponse, orjson
+
+
+def make_rows(count, text_length):
+    text = ("Strategic planning, financial modelling and stakeholder engagement. " * 40)[:text_length]
+    rows = []
+    for i in range(count):
+        row = [f"zcrm_{i:06d}", f"Consultant {i}", f"consultant{i}@example.com", "+1 555 0100"]
+        row += ["Finance", "Boston, MA", "Active"]
+        row += [text] * 9  # skills, passion, projects, description, keywords
+        row += ["Senior Advisor", decimal.Decimal("150.00"), decimal.Decimal("250.00")]
+        row += [datetime.datetime(2024, 5, 1, 12, 30)]
+        rows.append((tuple(row), 0.9 - i * 0.001))
+    return rows
+
+
+def previous_path(rows):
+    consultants = []
+    for row, similarity in rows:
+        consultant = {column: row[i] for i, column in enumerate(RESULT_COLUMNS)}
+        consultant['similarity_score'] = similarity
+        consultants.append(consultant)
+    response = ConsultantSearchResponse(
+        consultants=consultants,
+        total_found=len(consultants),
+        query="marketing strategy",
+        processing_time=0.1,
+        search_stats={'backend': 'pgvector'},
+    )
+    # What FastAPI does with a response_model: validate, encode, json.dumps
+    return JSONResponse(jsonable_encoder(response)).body
+
+
+def fast_path(rows):
+    consultants = []
+    for row, similarity in rows:
+        consultant = map_result_row(row)
+        consultant['similarity_score'] = similarity
+        consultants.append(consultant)
+    return FastJSONResponse({
+        "consultants": consultants,
+        "total_found": len(consultants),
+        "query": "marketing strategy",
+        "processing_time": 0.1,
+        "search_stats": {'backend': 'pgvector'},
+    }).body
+
+
+def measure(label, func, rows, runs):
+    func(rows)  # warm-up
+    timings = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        body = func(rows)
+        timings.append((time.perf_counter() - start_time) * 1000)
+    median = statistics.median(timings)
+    print(f"   {label:<28} p50 {median:7.3f}ms   max {max(timings):7.3f}ms   {len(body) / 1024:7.1f} KiB")
+    return median
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark /search response serialization")
+    parser.add_argument("--results", type=int, nargs="*", default=[10, 50], help="results per response")
+    parser.add_argument("--text-length", type=int, default=1500, help="characters per long text field")
+    parser.add_argument("--runs", type=int, default=500, help="timed runs per path")
+    args = parser.parse_args()
+
+    print("🚀 Search Response Serialization Benchmark")
+    print("=" * 60)
+    print(f"JSON encoder for fast path: {'orjson ' + orjson.__version__ if orjson else 'stdlib json (orjson not installed)'}")
+
+    for count in args.results:
+        rows = make_rows(count, args.text_length)
+        print(f"\n📊 {count} results, {args.text_length}-char text fields")
+        before = measure("previous (pydantic + json)", previous_path, rows, args.runs)
+        after = measure("fast (mapper + orjson)", fast_path, rows, args.runs)
+        print(f"   Speed-up: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
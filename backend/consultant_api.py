@@ -4,23 +4,94 @@ FastAPI Consultant Suggestion System
 Uses vector embeddings for semantic search and consultant recommendations
 """
 
+import asyncio
 import os
-import psycopg2
-import openai
+import time
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional, Tuple
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import uvicorn
 
+from db_pool import AsyncConnectionPool, PoolTimeoutError
+from embedding_cache import EmbeddingCache
+from embedding_batcher import EmbeddingBatcher
+from embedding_provider import create_embedding_provider
+from embedding_store import AsyncEmbeddingStore
+from vector_index import RESULT_COLUMNS, VectorIndex
+import vector_quantization
+from hybrid_search import is_keyword_query, reciprocal_rank_fusion
+from name_index import NameIndex
+from data_version import DataVersion
+from pagination import NEXT, PREV, decode_cursor, encode_cursor
+from export_stream import EXPORT_FORMATS, accepts_gzip, gzip_stream, serialize_rows
+from profile_cache import ProfileCache
+from result_cache import ResultCache
+from semantic_cache import SemanticCache
+from reranker import Reranker
+from http_cache import cache_headers, etag_matches
+from serialization import FastJSONResponse, row_mapper, dumps
+
 # Load .env from parent directory (project root)
 env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
 load_dotenv(dotenv_path=env_path)
 # Also try loading from current directory and parent directory without path
 load_dotenv()
 
+# pgvector's default hnsw.ef_search, and the largest value it accepts
+HNSW_DEFAULT_EF_SEARCH = 40
+HNSW_MAX_EF_SEARCH = 1000
+
+# Upper bound on results per search request
+MAX_SEARCH_LIMIT = 100
+
+
+# Columns returned by GET /consultants, in result order
+LIST_COLUMNS = (
+    'consultant_id', 'name', 'email', 'phone', 'practice_area', 'location',
+    'consultant_status', 'business_strategy_skills', 'finance_skills',
+    'law_skills', 'marketing_pr_skills', 'nonprofit_skills',
+    'professional_passion', 'projects_excite', 'description', 'keywords',
+)
+
+# Row-to-dict mappers bound once at import
+map_result_row = row_mapper(RESULT_COLUMNS)
+map_batch_result_row = row_mapper(RESULT_COLUMNS, offset=1)  # rows lead with the query position
+map_list_row = row_mapper(LIST_COLUMNS)
+
+# Every column GET /consultant/{id} can return, in response order
+PROFILE_COLUMNS = (
+    'consultant_id', 'first_name', 'last_name', 'name', 'email', 'phone', 'mobile', 'home_phone', 'other_phone', 'fax',
+    'contact_type', 'consultant_status', 'contact_owner', 'lead_source', 'consultant_lead_source', 'account_name',
+    'title', 'department', 'mailing_street', 'mailing_city', 'mailing_state', 'mailing_zip', 'mailing_country', 'location',
+    'practice_area', 'hourly_rate_low', 'hourly_rate_high', 'hourly_rate_range',
+    'business_strategy_skills', 'finance_skills', 'law_skills', 'marketing_pr_skills', 'nonprofit_skills',
+    'professional_passion', 'projects_excite', 'open_to_fulltime', 'how_heard_about_us', 'referred_by',
+    'professional_reference_1_name', 'professional_reference_1_organization', 'professional_reference_1_title',
+    'professional_reference_1_email', 'professional_reference_1_phone', 'professional_reference_1_notes',
+    'professional_reference_2_name', 'professional_reference_2_organization', 'professional_reference_2_title',
+    'professional_reference_2_email', 'professional_reference_2_phone', 'professional_reference_2_notes',
+    'description', 'interview_notes', 'reference_call_notes', 'keywords', 'linkedin', 'linkedin_connection',
+    'invitation_lists', 'created_time', 'modified_time', 'last_activity_time', 'extracted_at', 'zoho_data',
+)
+
+# Named projections for ?fields=; "card" matches the frontend Consultant type
+PROFILE_FIELD_SETS = {
+    'card': LIST_COLUMNS,
+}
+
+# Columns GET /consultants/export may select; defaults to the search result columns
+EXPORT_COLUMNS = RESULT_COLUMNS + (
+    'first_name', 'last_name', 'account_name', 'hourly_rate_range',
+    'created_time', 'modified_time', 'extracted_at',
+)
+
+# Upper bound on queries per /search/batch request
+MAX_BATCH_QUERIES = 100
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -28,15 +99,35 @@ logger = logging.getLogger(__name__)
 # Pydantic models
 class ConsultantSearchRequest(BaseModel):
     query: str
-    limit: int = 10
+    # semantic: vector only; hybrid: full-text + vector fused by RRF; lexical: full-text only
+    mode: Literal["semantic", "hybrid", "lexical"] = "semantic"
+    limit: int = Field(default=10, ge=1, le=MAX_SEARCH_LIMIT)
+    min_similarity: float = 0.7
+    filter_active: bool = False
+    # HNSW candidate list size for this query (higher = better recall, slower)
+    ef_search: Optional[int] = Field(default=None, ge=1, le=HNSW_MAX_EF_SEARCH)
+    # Candidates fetched per requested result before threshold filtering
+    overfetch: Optional[int] = Field(default=None, ge=1, le=20)
+    # Second stage: rescore the top RERANK_CANDIDATES with status/recency/rate boosts
+    rerank: bool = False
+    # Hourly budget for the rate-fit boost
+    budget: Optional[float] = Field(default=None, gt=0)
+    # Per-request boost weights overriding RERANK_WEIGHT_* (keys: status, recency, rate)
+    rerank_weights: Optional[Dict[str, float]] = None
+
+class ConsultantBatchSearchRequest(BaseModel):
+    queries: List[str]
+    limit: int = Field(default=10, ge=1, le=MAX_SEARCH_LIMIT)
     min_similarity: float = 0.7
     filter_active: bool = False
+    ef_search: Optional[int] = Field(default=None, ge=1, le=HNSW_MAX_EF_SEARCH)
 
 class ConsultantSearchResponse(BaseModel):
     consultants: List[Dict[str, Any]]
     total_found: int
     query: str
     processing_time: float
+    search_stats: Dict[str, Any] = {}
 
 class ConsultantDetail(BaseModel):
     consultant_id: str
@@ -64,248 +155,579 @@ class ConsultantSuggestionService:
         # Database configuration
         self.postgres_url = os.getenv("POSTGRES_URL")
         
-        # OpenAI configuration
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.openai_client = openai.OpenAI(api_key=self.openai_api_key) if self.openai_api_key else None
+        # Embedding backend (EMBEDDING_PROVIDER: openai, local or hashing); must match the ETL's
+        self.embedding_provider = create_embedding_provider()
+        self.embedding_model = self.embedding_provider.model
+        
+        # Repeated queries skip the embeddings round-trip
+        self.embedding_cache = EmbeddingCache(
+            max_entries=int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000")),
+            ttl=float(os.getenv("EMBEDDING_CACHE_TTL", "86400")),
+        )
+        
+        # Concurrent cache misses share one list-input embeddings call
+        self.embedding_batcher = EmbeddingBatcher(
+            self.create_embeddings,
+            window=float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5")) / 1000,
+            max_batch_size=int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "256")),
+            is_input_error=self.embedding_provider.is_input_error,
+        )
         
         if not self.postgres_url:
             raise ValueError("POSTGRES_URL not found in .env file")
         
-        if not self.openai_api_key:
-            raise ValueError("OPENAI_API_KEY not found in .env file")
+        # Async connection pool shared by every endpoint (opened on app startup)
+        self.pool = AsyncConnectionPool(
+            self.postgres_url,
+            min_size=int(os.getenv("POSTGRES_POOL_MIN_SIZE", "1")),
+            max_size=int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+            max_uses=int(os.getenv("POSTGRES_POOL_MAX_USES", "1000")),
+            max_lifetime=float(os.getenv("POSTGRES_POOL_MAX_LIFETIME", "1800")),
+            timeout=float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+            health_check_interval=float(os.getenv("POSTGRES_POOL_HEALTH_CHECK_INTERVAL", "30")),
+        )
+        
+        # Persistent embeddings shared with the ETL scripts
+        self.embedding_store = AsyncEmbeddingStore(self.pool)
+        
+        # Consultant data version, polled so caches can key on it
+        self.data_version = DataVersion(self.pool)
+        self.data_version_poll_interval = float(os.getenv("DATA_VERSION_POLL_INTERVAL", "5"))
+        
+        # Optional in-process exact search ("memory") instead of the pgvector index ("pgvector");
+        # the matrix reloads when the data version moves, checked in memory every interval
+        self.search_backend = os.getenv("SEARCH_BACKEND", "pgvector")
+        self.vector_index = VectorIndex(self.pool, self.data_version) if self.search_backend == "memory" else None
+        self.vector_index_refresh_interval = float(
+            os.getenv("VECTOR_INDEX_REFRESH_INTERVAL", str(self.data_version_poll_interval))
+        )
+        self.search_overfetch = int(os.getenv("SEARCH_OVERFETCH", "4"))
+        # Optional compact first pass (halfvec or binary index) re-scored against the full vectors
+        self.vector_quantization = vector_quantization.validate_mode(os.getenv("VECTOR_QUANTIZATION", "none"))
+        self.vector_rerank_factor = int(os.getenv("VECTOR_RERANK_FACTOR", "4"))
+        self.vector_candidates_sql = vector_quantization.candidates_sql(
+            self.vector_quantization, self.embedding_provider.dimensions
+        )
+        self.hybrid_rrf_k = int(os.getenv("HYBRID_RRF_K", "60"))
+        self.name_similarity_threshold = float(os.getenv("NAME_SIMILARITY_THRESHOLD", "0.3"))
+        self.chat_name_confidence = float(os.getenv("CHAT_NAME_CONFIDENCE", "0.5"))
+        self._consultant_count: Optional[Tuple[int, int]] = None
+        self.export_fetch_size = int(os.getenv("EXPORT_FETCH_SIZE", "1000"))
+        self.profile_cache = ProfileCache(int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "2000")))
+        self.result_cache = ResultCache(int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1000")))
+        self.reranker = Reranker(
+            status_weight=float(os.getenv("RERANK_WEIGHT_STATUS", "0.05")),
+            recency_weight=float(os.getenv("RERANK_WEIGHT_RECENCY", "0.05")),
+            rate_weight=float(os.getenv("RERANK_WEIGHT_RATE", "0.05")),
+            recency_half_life_days=float(os.getenv("RERANK_RECENCY_HALF_LIFE_DAYS", "180")),
+        )
+        self.rerank_candidates = int(os.getenv("RERANK_CANDIDATES", "50"))
+        # Off by default: at 0.95, ada-002 puts queries with different intent
+        # ("... in Boston" / "... in Denver") above the threshold; tune it on real queries first
+        semantic_cache_max_entries = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "0"))
+        self.semantic_cache = SemanticCache(
+            max_entries=semantic_cache_max_entries,
+            threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+        ) if semantic_cache_max_entries > 0 else None
+        self.http_cache_max_age = int(os.getenv("HTTP_CACHE_MAX_AGE", "0"))
+        
+        # /stats snapshot: (data version, stats, computed_at)
+        self._stats_snapshot: Optional[Tuple[int, Dict[str, Any], float]] = None
+        self.stats_refresh_interval = float(os.getenv("STATS_REFRESH_INTERVAL", "300"))
+        
+        # In-process prefix index for name autocomplete
+        self.name_index = NameIndex(self.pool)
+        self.name_index_refresh_interval = float(os.getenv("NAME_INDEX_REFRESH_INTERVAL", "60"))
+        
+        self.background_tasks: List[asyncio.Task] = []
     
-    def get_query_embedding(self, query: str) -> Optional[List[float]]:
-        """Generate embedding for search query"""
-        try:
-            response = self.openai_client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=query
+    async def start(self):
+        """Open the pool and start background refreshers on the running event loop"""
+        await self.pool.open()
+        if self.vector_index:
+            self.background_tasks.append(
+                asyncio.create_task(self.vector_index.run_refresh_loop(self.vector_index_refresh_interval))
             )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.error(f"Error generating query embedding: {e}")
-            return None
+        self.background_tasks.append(
+            asyncio.create_task(self.data_version.run_refresh_loop(self.data_version_poll_interval))
+        )
+        self.background_tasks.append(
+            asyncio.create_task(self.name_index.run_refresh_loop(self.name_index_refresh_interval))
+        )
+        self.background_tasks.append(asyncio.create_task(self.run_stats_refresh_loop()))
     
-    def search_consultants(self, query: str, limit: int = 10, min_similarity: float = 0.7, filter_active: bool = False) -> List[Dict[str, Any]]:
+    async def stop(self):
+        """Cancel background refreshers and close pooled connections"""
+        for task in self.background_tasks:
+            task.cancel()
+        await asyncio.gather(*self.background_tasks, return_exceptions=True)
+        self.background_tasks = []
+        await self.pool.close()
+    
+    async def get_query_embedding(self, query: str) -> Optional[List[float]]:
+        """Generate embedding for search query, served from the cache or embedding store when possible"""
+        return (await self.get_query_embeddings([query]))[0]
+    
+    async def get_query_embeddings(self, queries: List[str]) -> List[Optional[List[float]]]:
+        """Embed several queries: in-memory cache, then one embedding store lookup, then the batched API call
+
+        The provider always sees the text as typed (case matters for acronyms
+        and names), so every cache in front of it is keyed by that exact text.
+        """
+        embeddings = [self.embedding_cache.get(self.embedding_model, query) for query in queries]
+        missing = {
+            query
+            for query, embedding in zip(queries, embeddings)
+            if embedding is None and query.strip()
+        }
+        if not missing:
+            return embeddings
+        
+        resolved = await self.embedding_store.get_many(self.embedding_model, missing)
+        to_embed = [text for text in missing if text not in resolved]
+        if to_embed:
+            generated = await asyncio.gather(
+                *(self.embedding_batcher.embed(text) for text in to_embed),
+                return_exceptions=True
+            )
+            errors = [embedding for embedding in generated if isinstance(embedding, Exception)]
+            if errors:
+                logger.error(f"Error generating query embedding: {errors[0]}")
+            resolved.update(
+                (text, embedding)
+                for text, embedding in zip(to_embed, generated)
+                if embedding is not None and not isinstance(embedding, Exception)
+            )
+        
+        for i, query in enumerate(queries):
+            if embeddings[i] is None:
+                embedding = resolved.get(query)
+                if embedding is not None:
+                    self.embedding_cache.put(self.embedding_model, query, embedding)
+                    embeddings[i] = embedding
+        return embeddings
+    
+    async def create_embeddings(self, texts: List[str]) -> Dict[str, List[float]]:
+        """One list-input call to the embedding provider, persisted to the embedding store"""
+        generated = dict(zip(texts, await self.embedding_provider.aembed(texts)))
+        await self.embedding_store.put_many(self.embedding_model, generated)
+        return generated
+    
+    async def search_consultants(self, query: str, limit: int = 10, min_similarity: float = 0.7, filter_active: bool = False, ef_search: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search consultants using merged embedding column"""
+        results, _ = await self.search_consultants_with_stats(query, limit, min_similarity, filter_active, ef_search)
+        return results
+    
+    async def search_consultants_with_stats(self, query: str, limit: int = 10, min_similarity: float = 0.7, filter_active: bool = False, ef_search: Optional[int] = None, overfetch: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Two-phase semantic search returning results plus candidate statistics
+        
+        Phase 1 fetches limit * overfetch candidates in index order, computing the
+        distance once per row. Phase 2 applies the similarity threshold and status
+        filter to that small set and loads full rows only for the survivors.
+        Complete results are cached per data version, by exact query text
+        and, through the semantic cache, for near-duplicate query embeddings.
+        """
+        overfetch = overfetch or self.search_overfetch
+        cache_key = ('semantic', query, limit, min_similarity, filter_active, ef_search, overfetch)
+        version, cached = await self.get_cached_results(cache_key)
+        if cached:
+            return cached
+        
+        search_stats = {'backend': self.search_backend, 'result_cache': 'miss'}
         try:
             # Generate embedding for query
-            query_embedding = self.get_query_embedding(query)
+            query_embedding = await self.get_query_embedding(query)
             if not query_embedding:
-                return []
+                return [], search_stats
+            
+            # A paraphrase of a recent query reuses its ranking
+            if self.semantic_cache and version is not None:
+                match = self.semantic_cache.get(query_embedding, cache_key[2:], version)
+                if match:
+                    (results, cached_stats), similarity, matched_query = match
+                    cached_stats.update({
+                        'result_cache': 'semantic_hit',
+                        'semantic_cache_similarity': similarity,
+                        'semantic_cache_query': matched_query,
+                    })
+                    self.result_cache.put(cache_key, version, results, cached_stats)
+                    return results, cached_stats
+            
+            # Exact in-process search once the matrix is loaded
+            if self.vector_index and self.vector_index.is_loaded:
+                search_stats['backend'] = 'memory'
+                results = self.vector_index.search(query_embedding, limit, min_similarity, filter_active)
+                self.store_results(cache_key, version, results, search_stats, query, query_embedding)
+                return results, search_stats
+            
+            search_stats['backend'] = 'pgvector'
+            if self.vector_quantization != 'none':
+                search_stats['quantization'] = self.vector_quantization
+            # HNSW cannot return more rows than its ef_search ceiling
+            candidate_limit = min(limit * overfetch, HNSW_MAX_EF_SEARCH)
             
             # Convert to PostgreSQL vector format
             embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
             
-            # Connect to database
-            conn = psycopg2.connect(self.postgres_url)
-            cursor = conn.cursor()
+            # Borrow a pooled connection
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                # Phase 1: index-ordered candidate fetch, no threshold in the WHERE clause
+                candidates = await self.fetch_ann_candidates(cursor, embedding_str, candidate_limit, ef_search, search_stats)
+                
+                # Phase 2: threshold and status filter on the small candidate set
+                kept = []
+                for consultant_id, consultant_status, distance in candidates:
+                    similarity = 1 - float(distance)
+                    if similarity < min_similarity:
+                        continue
+                    if filter_active and consultant_status != 'Active':
+                        continue
+                    kept.append((consultant_id, similarity))
+                survivors = kept[:limit]
+                
+                rows_by_id = await self.fetch_result_rows(cursor, [consultant_id for consultant_id, _ in survivors])
+                
+                await cursor.close()
+            
+            results = []
+            for consultant_id, similarity in survivors:
+                row = rows_by_id.get(consultant_id)
+                if row is None:
+                    continue
+                consultant = map_result_row(row)
+                consultant['similarity_score'] = similarity
+                results.append(consultant)
+            
+            search_stats.update({
+                'overfetch': overfetch,
+                'candidates_fetched': len(candidates),
+                'candidates_dropped': len(candidates) - len(kept),
+                # Every candidate was used and results are still short: raise overfetch
+                'underfilled': len(candidates) == candidate_limit and len(kept) < limit,
+            })
+            self.store_results(cache_key, version, results, search_stats, query, query_embedding)
+            return results, search_stats
             
-            # Build the WHERE clause based on filters
-            where_conditions = ["embedding IS NOT NULL", f"1 - (embedding <=> %s::vector) >= %s"]
-            params = [embedding_str, embedding_str, min_similarity]
-            
-            if filter_active:
-                where_conditions.append("consultant_status = 'Active'")
-            
-            where_clause = " AND ".join(where_conditions)
-            
-            # Search for similar consultants using merged embedding
-            cursor.execute(f"""
-                SELECT 
-                    consultant_id, name, email, phone, practice_area, location,
-                    consultant_status, business_strategy_skills, finance_skills,
-                    law_skills, marketing_pr_skills, nonprofit_skills,
-                    professional_passion, projects_excite, description, keywords,
-                    title, hourly_rate_low, hourly_rate_high,
-                    1 - (embedding <=> %s::vector) as similarity
-                FROM consultants 
-                WHERE {where_clause}
-                ORDER BY embedding <=> %s::vector
+        except Exception as e:
+            logger.error(f"Error searching consultants: {e}")
+            return [], search_stats
+    
+    async def get_cached_results(self, cache_key: tuple) -> Tuple[Optional[int], Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]]]:
+        """Current data version and the cached search for ``cache_key``, if any"""
+        try:
+            version = await self.data_version.current()
+        except Exception as e:
+            logger.warning(f"⚠️ Data version unavailable, bypassing result cache: {e}")
+            return None, None
+        cached = self.result_cache.get(cache_key, version)
+        if cached:
+            cached[1]['result_cache'] = 'hit'
+        return version, cached
+    
+    def store_results(self, cache_key: tuple, version: Optional[int], results: List[Dict[str, Any]], search_stats: Dict[str, Any], query: Optional[str] = None, query_embedding: Optional[List[float]] = None):
+        """Cache a complete search computed against ``version``
+        
+        Semantic searches also pass their query and embedding so paraphrases
+        can find them in the semantic cache.
+        """
+        if version is None:
+            return
+        if self.vector_index and self.vector_index.is_loaded and self.vector_index.version != version:
+            # The in-process matrix has not reloaded for this version yet; its
+            # ranking must not be cached under it
+            return
+        self.result_cache.put(cache_key, version, results, search_stats)
+        if self.semantic_cache and query_embedding is not None:
+            # Everything but mode and query text must match for a paraphrase to reuse the ranking
+            self.semantic_cache.put(query, query_embedding, cache_key[2:], version, results, search_stats)
+    
+    async def fetch_ann_candidates(self, cursor, embedding_str: str, limit: int, ef_search: Optional[int] = None, search_stats: Optional[Dict[str, Any]] = None) -> List[tuple]:
+        """Index-ordered (consultant_id, consultant_status, distance) rows, distance computed once per row
+        
+        With VECTOR_QUANTIZATION set, the index scan runs on the compact
+        vectors for limit * VECTOR_RERANK_FACTOR rows and the returned
+        distances are exact, from the full-precision column. The scan is
+        capped at HNSW_MAX_EF_SEARCH rows; ``search_stats`` records when it was.
+        """
+        # Per-request HNSW recall/latency trade-off, scoped to this transaction.
+        # HNSW returns at most ef_search rows, so it must cover the first pass,
+        # and pgvector rejects values above HNSW_MAX_EF_SEARCH.
+        limit = min(limit, HNSW_MAX_EF_SEARCH)
+        wanted = vector_quantization.first_pass_limit(self.vector_quantization, limit, self.vector_rerank_factor)
+        first_pass = min(wanted, HNSW_MAX_EF_SEARCH)
+        if first_pass < wanted and search_stats is not None:
+            search_stats['first_pass_clamped'] = {'requested': wanted, 'limit': first_pass}
+        if ef_search or first_pass > HNSW_DEFAULT_EF_SEARCH:
+            ef_search = min(max(ef_search or 0, first_pass), HNSW_MAX_EF_SEARCH)
+            await cursor.execute(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+        await cursor.execute(self.vector_candidates_sql, vector_quantization.candidates_params(
+            self.vector_quantization, embedding_str, limit, self.vector_rerank_factor, HNSW_MAX_EF_SEARCH
+        ))
+        return await cursor.fetchall()
+    
+    async def fetch_result_rows(self, cursor, consultant_ids: List[str]) -> Dict[str, tuple]:
+        """Load search result columns for the given ids, keyed by consultant_id"""
+        if not consultant_ids:
+            return {}
+        await cursor.execute(f"""
+            SELECT {', '.join(RESULT_COLUMNS)}
+            FROM consultants 
+            WHERE consultant_id = ANY(%s)
+        """, (list(consultant_ids),))
+        return {row[0]: row for row in await cursor.fetchall()}
+    
+    async def fetch_lexical_candidates(self, query: str, limit: int, filter_active: bool = False) -> List[Tuple[str, float]]:
+        """Full-text candidates ranked by ts_rank_cd, served by the search_text GIN index"""
+        active_condition = "AND consultant_status = 'Active'" if filter_active else ""
+        async with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            await cursor.execute(f"""
+                SELECT consultant_id, ts_rank_cd(to_tsvector('english', search_text), tsq) AS rank
+                FROM consultants, websearch_to_tsquery('english', %s) AS tsq
+                WHERE to_tsvector('english', search_text) @@ tsq {active_condition}
+                ORDER BY rank DESC
                 LIMIT %s
-            """, params + [embedding_str, limit])
+            """, (query, limit))
+            rows = await cursor.fetchall()
+            await cursor.close()
+        return [(consultant_id, float(rank)) for consultant_id, rank in rows]
+    
+    async def fetch_vector_candidates(self, query: str, limit: int, min_similarity: float, filter_active: bool = False, ef_search: Optional[int] = None, search_stats: Optional[Dict[str, Any]] = None) -> List[Tuple[str, float]]:
+        """ANN candidates above the similarity threshold as (consultant_id, similarity)"""
+        query_embedding = await self.get_query_embedding(query)
+        if not query_embedding:
+            return []
+        
+        if self.vector_index and self.vector_index.is_loaded:
+            return [
+                (consultant['consultant_id'], consultant['similarity_score'])
+                for consultant in self.vector_index.search(query_embedding, limit, min_similarity, filter_active)
+            ]
+        
+        embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
+        async with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            candidates = await self.fetch_ann_candidates(cursor, embedding_str, limit, ef_search, search_stats)
+            await cursor.close()
+        
+        return [
+            (consultant_id, 1 - float(distance))
+            for consultant_id, consultant_status, distance in candidates
+            if 1 - float(distance) >= min_similarity and (not filter_active or consultant_status == 'Active')
+        ]
+    
+    async def hybrid_search_consultants(self, query: str, limit: int = 10, min_similarity: float = 0.7, filter_active: bool = False, ef_search: Optional[int] = None, mode: str = "hybrid") -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Full-text and ANN retrieval run concurrently and fused with reciprocal-rank fusion
+        
+        Keyword lookups (or mode="lexical") take the lexical-only fast path and
+        never call the embeddings API; a keyword lookup with fewer than
+        ``limit`` lexical matches falls back to full hybrid retrieval. Complete
+        results are cached per data version unless a retriever failed.
+        """
+        lexical_only = mode == "lexical" or is_keyword_query(query)
+        cache_key = ('lexical' if mode == "lexical" else 'hybrid', query, limit, min_similarity, filter_active, ef_search)
+        version, cached = await self.get_cached_results(cache_key)
+        if cached:
+            return cached
+        
+        search_stats = {'mode': 'lexical' if lexical_only else 'hybrid', 'result_cache': 'miss'}
+        degraded = False
+        candidate_limit = limit * self.search_overfetch
+        try:
+            if lexical_only:
+                lexical = await self.fetch_lexical_candidates(query, candidate_limit, filter_active)
+                vector = []
+                if mode != "lexical" and len(lexical) < limit:
+                    # Too few exact matches for a keyword-looking query: add the vector side
+                    search_stats.update({'mode': 'hybrid', 'keyword_fallback': True})
+                    try:
+                        vector = await self.fetch_vector_candidates(query, candidate_limit, min_similarity, filter_active, ef_search, search_stats)
+                    except Exception as e:
+                        logger.error(f"Error in vector retrieval: {e}")
+                        degraded = True
+            else:
+                lexical, vector = await asyncio.gather(
+                    self.fetch_lexical_candidates(query, candidate_limit, filter_active),
+                    self.fetch_vector_candidates(query, candidate_limit, min_similarity, filter_active, ef_search, search_stats),
+                    return_exceptions=True
+                )
+                # One failed retriever degrades to the other instead of failing the search
+                if isinstance(lexical, Exception):
+                    logger.error(f"Error in lexical retrieval: {lexical}")
+                    lexical, degraded = [], True
+                if isinstance(vector, Exception):
+                    logger.error(f"Error in vector retrieval: {vector}")
+                    vector, degraded = [], True
+            
+            fused = reciprocal_rank_fusion(
+                [[consultant_id for consultant_id, _ in lexical], [consultant_id for consultant_id, _ in vector]],
+                k=self.hybrid_rrf_k
+            )[:limit]
+            
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                rows_by_id = await self.fetch_result_rows(cursor, [consultant_id for consultant_id, _ in fused])
+                await cursor.close()
             
+            similarities = dict(vector)
             results = []
-            for row in cursor.fetchall():
-                consultant = {
-                    'consultant_id': row[0],
-                    'name': row[1],
-                    'email': row[2],
-                    'phone': row[3],
-                    'practice_area': row[4],
-                    'location': row[5],
-                    'consultant_status': row[6],
-                    'business_strategy_skills': row[7],
-                    'finance_skills': row[8],
-                    'law_skills': row[9],
-                    'marketing_pr_skills': row[10],
-                    'nonprofit_skills': row[11],
-                    'professional_passion': row[12],
-                    'projects_excite': row[13],
-                    'description': row[14],
-                    'keywords': row[15],
-                    'title': row[16],
-                    'hourly_rate_low': row[17],
-                    'hourly_rate_high': row[18],
-                    'similarity_score': float(row[19])
-                }
+            for consultant_id, rrf_score in fused:
+                row = rows_by_id.get(consultant_id)
+                if row is None:
+                    continue
+                consultant = map_result_row(row)
+                consultant['similarity_score'] = similarities.get(consultant_id)
+                consultant['rrf_score'] = rrf_score
                 results.append(consultant)
             
-            cursor.close()
-            conn.close()
+            search_stats.update({
+                'lexical_candidates': len(lexical),
+                'vector_candidates': len(vector),
+            })
+            if not degraded:
+                self.store_results(cache_key, version, results, search_stats)
+            return results, search_stats
             
-            return results
+        except Exception as e:
+            logger.error(f"Error in hybrid search: {e}")
+            return [], search_stats
+    
+    async def search_consultants_batch(self, queries: List[str], limit: int = 10, min_similarity: float = 0.7, filter_active: bool = False, ef_search: Optional[int] = None) -> Tuple[List[List[Dict[str, Any]]], Dict[str, float]]:
+        """Search several queries with one embeddings call and one SQL round-trip
+        
+        Returns per-query result lists in input order plus phase timings.
+        """
+        results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        timings = {'embedding': 0.0, 'database': 0.0}
+        try:
+            start_time = time.time()
+            query_embeddings = await self.get_query_embeddings(queries)
+            timings['embedding'] = time.time() - start_time
+            
+            positions = [i for i, embedding in enumerate(query_embeddings) if embedding]
+            if not positions:
+                return results, timings
+            
+            start_time = time.time()
+            if self.vector_index and self.vector_index.is_loaded:
+                for i in positions:
+                    results[i] = self.vector_index.search(query_embeddings[i], limit, min_similarity, filter_active)
+                timings['database'] = time.time() - start_time
+                return results, timings
+            
+            candidate_limit = min(limit * self.search_overfetch, HNSW_MAX_EF_SEARCH)
+            embedding_strs = ['[' + ','.join(map(str, query_embeddings[i])) + ']' for i in positions]
+            active_condition = "AND c.consultant_status = 'Active'" if filter_active else ""
+            columns = ', '.join(f"c.{column}" for column in RESULT_COLUMNS)
+            
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                if ef_search or candidate_limit > HNSW_DEFAULT_EF_SEARCH:
+                    await cursor.execute(f"SET LOCAL hnsw.ef_search = {int(min(max(ef_search or 0, candidate_limit), HNSW_MAX_EF_SEARCH))}")
+                
+                # Per query: index-ordered candidates, then threshold and top-k on that small set
+                await cursor.execute(f"""
+                    SELECT q.position, r.*
+                    FROM unnest(%s::int[], %s::text[]) AS q(position, query_embedding)
+                    CROSS JOIN LATERAL (
+                        SELECT {columns}, 1 - k.distance AS similarity
+                        FROM (
+                            SELECT consultant_id, embedding <=> q.query_embedding::vector AS distance
+                            FROM consultants
+                            WHERE embedding IS NOT NULL
+                            ORDER BY distance
+                            LIMIT %s
+                        ) k
+                        JOIN consultants c ON c.consultant_id = k.consultant_id
+                        WHERE 1 - k.distance >= %s {active_condition}
+                        ORDER BY k.distance
+                        LIMIT %s
+                    ) r
+                    ORDER BY q.position, r.similarity DESC
+                """, (positions, embedding_strs, candidate_limit, min_similarity, limit))
+                rows = await cursor.fetchall()
+                await cursor.close()
+            
+            for row in rows:
+                consultant = map_batch_result_row(row)
+                consultant['similarity_score'] = float(row[-1])
+                results[row[0]].append(consultant)
+            timings['database'] = time.time() - start_time
+            
+            return results, timings
             
         except Exception as e:
-            logger.error(f"Error searching consultants: {e}")
-            return []
+            logger.error(f"Error in batch consultant search: {e}")
+            return results, timings
     
-    def get_consultant_by_id(self, consultant_id: str) -> Optional[Dict[str, Any]]:
-        """Get consultant details by ID"""
+    async def get_consultant_by_id(self, consultant_id: str, fields: Optional[Tuple[str, ...]] = None) -> Optional[Dict[str, Any]]:
+        """Get consultant details by ID, optionally projected to ``fields``
+        
+        Profiles are cached per (id, fields) for the current data version.
+        """
+        fields = tuple(fields) if fields else PROFILE_COLUMNS
         try:
-            conn = psycopg2.connect(self.postgres_url)
-            cursor = conn.cursor()
+            version = await self.data_version.current()
+            consultant = self.profile_cache.get(consultant_id, fields, version)
+            if consultant is not None:
+                return consultant
+            
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+            
+                await cursor.execute(f"""
+                    SELECT {', '.join(fields)}
+                    FROM consultants 
+                    WHERE consultant_id = %s
+                """, (consultant_id,))
             
-            cursor.execute("""
-                SELECT 
-                    consultant_id, first_name, last_name, name, email, phone, mobile, home_phone, other_phone, fax,
-                    contact_type, consultant_status, contact_owner, lead_source, consultant_lead_source, account_name,
-                    title, department, mailing_street, mailing_city, mailing_state, mailing_zip, mailing_country, location,
-                    practice_area, hourly_rate_low, hourly_rate_high, hourly_rate_range,
-                    business_strategy_skills, finance_skills, law_skills, marketing_pr_skills, nonprofit_skills,
-                    professional_passion, projects_excite, open_to_fulltime, how_heard_about_us, referred_by,
-                    professional_reference_1_name, professional_reference_1_organization, professional_reference_1_title,
-                    professional_reference_1_email, professional_reference_1_phone, professional_reference_1_notes,
-                    professional_reference_2_name, professional_reference_2_organization, professional_reference_2_title,
-                    professional_reference_2_email, professional_reference_2_phone, professional_reference_2_notes,
-                    description, interview_notes, reference_call_notes, keywords, linkedin, linkedin_connection,
-                    invitation_lists, created_time, modified_time, last_activity_time, extracted_at, zoho_data
-                FROM consultants 
-                WHERE consultant_id = %s
-            """, (consultant_id,))
-            
-            row = cursor.fetchone()
-            cursor.close()
-            conn.close()
+                row = await cursor.fetchone()
+                await cursor.close()
             
             if row:
-                return {
-                    'consultant_id': row[0],
-                    'first_name': row[1],
-                    'last_name': row[2],
-                    'name': row[3],
-                    'email': row[4],
-                    'phone': row[5],
-                    'mobile': row[6],
-                    'home_phone': row[7],
-                    'other_phone': row[8],
-                    'fax': row[9],
-                    'contact_type': row[10],
-                    'consultant_status': row[11],
-                    'contact_owner': row[12],
-                    'lead_source': row[13],
-                    'consultant_lead_source': row[14],
-                    'account_name': row[15],
-                    'title': row[16],
-                    'department': row[17],
-                    'mailing_street': row[18],
-                    'mailing_city': row[19],
-                    'mailing_state': row[20],
-                    'mailing_zip': row[21],
-                    'mailing_country': row[22],
-                    'location': row[23],
-                    'practice_area': row[24],
-                    'hourly_rate_low': row[25],
-                    'hourly_rate_high': row[26],
-                    'hourly_rate_range': row[27],
-                    'business_strategy_skills': row[28],
-                    'finance_skills': row[29],
-                    'law_skills': row[30],
-                    'marketing_pr_skills': row[31],
-                    'nonprofit_skills': row[32],
-                    'professional_passion': row[33],
-                    'projects_excite': row[34],
-                    'open_to_fulltime': row[35],
-                    'how_heard_about_us': row[36],
-                    'referred_by': row[37],
-                    'professional_reference_1_name': row[38],
-                    'professional_reference_1_organization': row[39],
-                    'professional_reference_1_title': row[40],
-                    'professional_reference_1_email': row[41],
-                    'professional_reference_1_phone': row[42],
-                    'professional_reference_1_notes': row[43],
-                    'professional_reference_2_name': row[44],
-                    'professional_reference_2_organization': row[45],
-                    'professional_reference_2_title': row[46],
-                    'professional_reference_2_email': row[47],
-                    'professional_reference_2_phone': row[48],
-                    'professional_reference_2_notes': row[49],
-                    'description': row[50],
-                    'interview_notes': row[51],
-                    'reference_call_notes': row[52],
-                    'keywords': row[53],
-                    'linkedin': row[54],
-                    'linkedin_connection': row[55],
-                    'invitation_lists': row[56],
-                    'created_time': row[57],
-                    'modified_time': row[58],
-                    'last_activity_time': row[59],
-                    'extracted_at': row[60],
-                    'zoho_data': row[61]
-                }
+                consultant = dict(zip(fields, row))
+                self.profile_cache.put(consultant_id, fields, version, consultant)
+                return consultant
             return None
             
         except Exception as e:
             logger.error(f"Error getting consultant {consultant_id}: {e}")
             return None
     
-    def search_consultants_by_name(self, name_query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search consultants by name (case-insensitive partial match)"""
+    async def search_consultants_by_name(self, name_query: str, limit: int = 10, min_similarity: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Search consultants by name, tolerant of typos
+        
+        Substring matches and trigram-similar names (above ``min_similarity``)
+        are both served by the pg_trgm GIN indexes on name and email and are
+        ranked by similarity(), substring matches first.
+        """
+        threshold = self.name_similarity_threshold if min_similarity is None else min_similarity
         try:
-            conn = psycopg2.connect(self.postgres_url)
-            cursor = conn.cursor()
-            
-            # Search for consultants by name (case-insensitive, partial match)
-            cursor.execute("""
-                SELECT 
-                    consultant_id, name, email, phone, practice_area, location,
-                    consultant_status, business_strategy_skills, finance_skills,
-                    law_skills, marketing_pr_skills, nonprofit_skills,
-                    professional_passion, projects_excite, description, keywords,
-                    title, hourly_rate_low, hourly_rate_high
-                FROM consultants 
-                WHERE LOWER(name) LIKE LOWER(%s)
-                ORDER BY name
-                LIMIT %s
-            """, (f"%{name_query}%", limit))
-            
-            results = []
-            for row in cursor.fetchall():
-                consultant = {
-                    'consultant_id': row[0],
-                    'name': row[1],
-                    'email': row[2],
-                    'phone': row[3],
-                    'practice_area': row[4],
-                    'location': row[5],
-                    'consultant_status': row[6],
-                    'business_strategy_skills': row[7],
-                    'finance_skills': row[8],
-                    'law_skills': row[9],
-                    'marketing_pr_skills': row[10],
-                    'nonprofit_skills': row[11],
-                    'professional_passion': row[12],
-                    'projects_excite': row[13],
-                    'description': row[14],
-                    'keywords': row[15],
-                    'title': row[16],
-                    'hourly_rate_low': row[17],
-                    'hourly_rate_high': row[18]
-                }
-                results.append(consultant)
-            
-            cursor.close()
-            conn.close()
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                # The % operator reads its cutoff from this setting; SET cannot take bind params
+                await cursor.execute(f"SET LOCAL pg_trgm.similarity_threshold = {float(threshold)}")
+                pattern = f"%{name_query}%"
+                await cursor.execute(f"""
+                    SELECT {', '.join(RESULT_COLUMNS)},
+                        GREATEST(similarity(name, %s), similarity(email, %s)) AS name_similarity
+                    FROM consultants 
+                    WHERE name ILIKE %s OR email ILIKE %s OR name %% %s
+                    ORDER BY name ILIKE %s DESC, name_similarity DESC, name
+                    LIMIT %s
+                """, (name_query, name_query, pattern, pattern, name_query, pattern, limit))
+                
+                results = []
+                for row in await cursor.fetchall():
+                    consultant = map_result_row(row)
+                    consultant['name_similarity'] = float(row[-1] or 0)
+                    results.append(consultant)
+                
+                await cursor.close()
             
             return results
             
@@ -313,31 +735,115 @@ class ConsultantSuggestionService:
             logger.error(f"Error searching consultants by name '{name_query}': {e}")
             return []
     
-    def get_database_stats(self) -> Dict[str, Any]:
+    async def count_consultants(self) -> int:
+        """Total consultants, cached until the data version changes"""
+        version = await self.data_version.current()
+        cached = self._consultant_count
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        async with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            await cursor.execute("SELECT COUNT(*) FROM consultants")
+            total = (await cursor.fetchone())[0]
+            await cursor.close()
+        self._consultant_count = (version, total)
+        return total
+    
+    async def list_consultants(self, limit: int = 50, cursor_token: Optional[str] = None, offset: int = 0) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+        """One page ordered by (name, consultant_id), plus next/prev cursor tokens
+        
+        Pages after the first seek straight to the boundary row through
+        idx_consultants_name_keyset instead of sorting and skipping ``offset``
+        rows; ``offset`` is only honoured when no cursor is given.
+        """
+        direction, after_name, after_id = decode_cursor(cursor_token) if cursor_token else (NEXT, None, None)
+        columns = ', '.join(LIST_COLUMNS)
+        sort_key = "(COALESCE(name, ''), consultant_id)"
+        
+        if cursor_token is None:
+            sql = f"SELECT {columns} FROM consultants ORDER BY COALESCE(name, ''), consultant_id LIMIT %s OFFSET %s"
+            params = (limit + 1, offset)
+        elif direction == NEXT:
+            sql = f"SELECT {columns} FROM consultants WHERE {sort_key} > (%s, %s) ORDER BY COALESCE(name, ''), consultant_id LIMIT %s"
+            params = (after_name, after_id, limit + 1)
+        else:
+            sql = f"SELECT {columns} FROM consultants WHERE {sort_key} < (%s, %s) ORDER BY COALESCE(name, '') DESC, consultant_id DESC LIMIT %s"
+            params = (after_name, after_id, limit + 1)
+        
+        async with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            await cursor.execute(sql, params)
+            rows = await cursor.fetchall()
+            await cursor.close()
+        
+        # The extra row only tells us whether another page exists in the read direction
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == PREV:
+            rows.reverse()
+        consultants = [map_list_row(row) for row in rows]
+        if not consultants:
+            return consultants, None, None
+        
+        first, last = consultants[0], consultants[-1]
+        if direction == NEXT:
+            has_next, has_prev = has_more, cursor_token is not None or offset > 0
+        else:
+            has_next, has_prev = True, has_more
+        next_cursor = encode_cursor(NEXT, last['name'], last['consultant_id']) if has_next else None
+        prev_cursor = encode_cursor(PREV, first['name'], first['consultant_id']) if has_prev else None
+        return consultants, next_cursor, prev_cursor
+    
+    async def stream_consultants(self, columns: List[str], filter_active: bool = False):
+        """Yield batches of export rows from a named server-side cursor
+        
+        Only ``export_fetch_size`` rows are held client-side at a time; the
+        pooled connection stays checked out until the export finishes or the
+        client disconnects.
+        """
+        active_condition = "WHERE consultant_status = 'Active'" if filter_active else ""
+        async with self.pool.connection() as conn:
+            cursor = conn.cursor(name="consultants_export")
+            try:
+                await cursor.execute(f"""
+                    SELECT {', '.join(columns)}
+                    FROM consultants
+                    {active_condition}
+                    ORDER BY consultant_id
+                """)
+                while True:
+                    rows = await cursor.fetchmany(self.export_fetch_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                await cursor.close()
+    
+    async def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         try:
-            conn = psycopg2.connect(self.postgres_url)
-            cursor = conn.cursor()
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
             
-            # Total consultants
-            cursor.execute("SELECT COUNT(*) FROM consultants")
-            total_consultants = cursor.fetchone()[0]
+                # Total consultants
+                await cursor.execute("SELECT COUNT(*) FROM consultants")
+                total_consultants = (await cursor.fetchone())[0]
             
-            # Consultants with embeddings
-            cursor.execute("SELECT COUNT(*) FROM consultants WHERE embedding IS NOT NULL")
-            with_embeddings = cursor.fetchone()[0]
+                # Consultants with embeddings
+                await cursor.execute("SELECT COUNT(*) FROM consultants WHERE embedding IS NOT NULL")
+                with_embeddings = (await cursor.fetchone())[0]
             
-            # Status distribution
-            cursor.execute("""
-                SELECT consultant_status, COUNT(*) 
-                FROM consultants 
-                GROUP BY consultant_status 
-                ORDER BY COUNT(*) DESC
-            """)
-            status_distribution = dict(cursor.fetchall())
+                # Status distribution
+                await cursor.execute("""
+                    SELECT consultant_status, COUNT(*) 
+                    FROM consultants 
+                    GROUP BY consultant_status 
+                    ORDER BY COUNT(*) DESC
+                """)
+                status_distribution = dict(await cursor.fetchall())
             
-            cursor.close()
-            conn.close()
+                await cursor.close()
             
             return {
                 'total_consultants': total_consultants,
@@ -350,6 +856,65 @@ class ConsultantSuggestionService:
             logger.error(f"Error getting database stats: {e}")
             return {}
 
+    async def check_database(self) -> bool:
+        """Readiness probe: one pooled round-trip"""
+        try:
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                await cursor.execute("SELECT 1")
+                await cursor.fetchone()
+                await cursor.close()
+            return True
+        except Exception as e:
+            logger.error(f"Database readiness check failed: {e}")
+            return False
+    
+    async def refresh_stats_snapshot(self) -> Dict[str, Any]:
+        """Recompute database statistics and tag them with the data version they reflect"""
+        version = await self.data_version.current()
+        stats = await self.get_database_stats()
+        if stats:
+            self._stats_snapshot = (version, stats, time.time())
+        return stats
+    
+    async def get_cached_database_stats(self) -> Dict[str, Any]:
+        """Database statistics from the last snapshot, computed once if none exists yet"""
+        snapshot = self._stats_snapshot
+        if snapshot is None:
+            return await self.refresh_stats_snapshot()
+        return snapshot[1]
+    
+    def get_stats_etag(self) -> Optional[str]:
+        """ETag of the current stats snapshot, None until one exists"""
+        snapshot = self._stats_snapshot
+        return self.data_version.etag(snapshot[0]) if snapshot else None
+    
+    async def run_stats_refresh_loop(self):
+        """Refresh the stats snapshot on a schedule, or once a sync has finished writing
+        
+        A sync bumps the data version many times; the snapshot is only
+        recomputed after the version has stayed put for a full poll interval.
+        """
+        while True:
+            try:
+                snapshot = self._stats_snapshot
+                data_version = self.data_version
+                settled = (
+                    data_version.changed_at is not None
+                    and time.time() - data_version.changed_at >= self.data_version_poll_interval
+                )
+                if (
+                    snapshot is None
+                    or time.time() - snapshot[2] >= self.stats_refresh_interval
+                    or (snapshot[0] != data_version.version and settled)
+                ):
+                    await self.refresh_stats_snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error refreshing stats snapshot: {e}")
+            await asyncio.sleep(self.data_version_poll_interval)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Consultant Suggestion System",
@@ -374,6 +939,18 @@ except Exception as e:
     logger.error(f"❌ Failed to initialize service: {e}")
     suggestion_service = None
 
+@app.on_event("startup")
+async def start_service():
+    """Open pooled database connections and background tasks on the server's event loop"""
+    if suggestion_service:
+        await suggestion_service.start()
+
+@app.on_event("shutdown")
+async def stop_service():
+    """Stop background tasks and close pooled connections on shutdown"""
+    if suggestion_service:
+        await suggestion_service.stop()
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -385,9 +962,9 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    if suggestion_service:
-        stats = suggestion_service.get_database_stats()
+    """Health check endpoint (readiness plus cached counts)"""
+    if suggestion_service and await suggestion_service.check_database():
+        stats = await suggestion_service.get_cached_database_stats()
         return {
             "status": "healthy",
             "database_connected": True,
@@ -400,61 +977,184 @@ async def health_check():
             "database_connected": False
         }
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is serving requests; never touches the database"""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: a single pooled SELECT 1"""
+    if not suggestion_service or not await suggestion_service.check_database():
+        raise HTTPException(status_code=503, detail="Database not reachable")
+    return {"status": "ready"}
+
 @app.post("/search", response_model=ConsultantSearchResponse)
 async def search_consultants(request: ConsultantSearchRequest):
     """Search consultants using semantic similarity"""
     if not suggestion_service:
         raise HTTPException(status_code=500, detail="Service not initialized")
     
+    if request.rerank:
+        try:
+            suggestion_service.reranker.resolve_weights(request.rerank_weights)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     import time
     start_time = time.time()
     
+    # The reranker needs a wider candidate set than the page it returns
+    retrieval_limit = max(request.limit, suggestion_service.rerank_candidates) if request.rerank else request.limit
+    
     try:
-        consultants = suggestion_service.search_consultants(
-            query=request.query,
-            limit=request.limit,
-            min_similarity=request.min_similarity,
-            filter_active=request.filter_active
-        )
+        if request.mode == "semantic":
+            consultants, search_stats = await suggestion_service.search_consultants_with_stats(
+                query=request.query,
+                limit=retrieval_limit,
+                min_similarity=request.min_similarity,
+                filter_active=request.filter_active,
+                ef_search=request.ef_search,
+                overfetch=request.overfetch
+            )
+        else:
+            consultants, search_stats = await suggestion_service.hybrid_search_consultants(
+                query=request.query,
+                limit=retrieval_limit,
+                min_similarity=request.min_similarity,
+                filter_active=request.filter_active,
+                ef_search=request.ef_search,
+                mode=request.mode
+            )
+        
+        if request.rerank:
+            retrieval_time = time.time() - start_time
+            rerank_start = time.time()
+            candidates = len(consultants)
+            # Hybrid and lexical rows only carry a similarity when the vector side found them
+            base_key = 'similarity_score' if request.mode == 'semantic' else 'rrf_score'
+            consultants = suggestion_service.reranker.rerank(
+                consultants, limit=request.limit, budget=request.budget, weights=request.rerank_weights,
+                base_key=base_key
+            )
+            search_stats['rerank'] = {'candidates': candidates, 'budget': request.budget, 'base': base_key}
+            search_stats['timings'] = {'retrieval': retrieval_time, 'rerank': time.time() - rerank_start}
         
         processing_time = time.time() - start_time
         
-        return ConsultantSearchResponse(
-            consultants=consultants,
-            total_found=len(consultants),
-            query=request.query,
-            processing_time=processing_time
-        )
+        # Rows are already JSON-shaped; skip response_model validation and jsonable_encoder
+        return FastJSONResponse({
+            "consultants": consultants,
+            "total_found": len(consultants),
+            "query": request.query,
+            "processing_time": processing_time,
+            "search_stats": search_stats
+        })
         
     except Exception as e:
         logger.error(f"Error in search: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/consultant/{consultant_id}")
-async def get_consultant(consultant_id: str):
-    """Get consultant details by ID"""
+@app.post("/search/batch")
+async def search_consultants_batch(request: ConsultantBatchSearchRequest):
+    """Search several queries with a single embeddings call and a single SQL round-trip"""
     if not suggestion_service:
         raise HTTPException(status_code=500, detail="Service not initialized")
     
+    if not request.queries or len(request.queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(status_code=400, detail=f"Provide between 1 and {MAX_BATCH_QUERIES} queries")
+    
+    start_time = time.time()
+    
     try:
-        consultant = suggestion_service.get_consultant_by_id(consultant_id)
-        if not consultant:
-            raise HTTPException(status_code=404, detail="Consultant not found")
+        batch_results, timings = await suggestion_service.search_consultants_batch(
+            queries=request.queries,
+            limit=request.limit,
+            min_similarity=request.min_similarity,
+            filter_active=request.filter_active,
+            ef_search=request.ef_search
+        )
         
-        return consultant
+        return FastJSONResponse({
+            "results": [
+                {
+                    "query": query,
+                    "consultants": consultants,
+                    "total_found": len(consultants)
+                }
+                for query, consultants in zip(request.queries, batch_results)
+            ],
+            "total_queries": len(request.queries),
+            "processing_time": time.time() - start_time,
+            "timings": timings
+        })
         
+    except Exception as e:
+        logger.error(f"Error in batch search: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+def not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """304 for a matching If-None-Match, answered from the in-memory data version alone"""
+    if etag and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers(etag, suggestion_service.http_cache_max_age))
+    return None
+
+def set_cache_headers(response: Response, etag: Optional[str]):
+    if etag:
+        response.headers.update(cache_headers(etag, suggestion_service.http_cache_max_age))
+
+def parse_profile_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Resolve ?fields= (a named set or comma-separated columns) to a column tuple"""
+    if not fields:
+        return None
+    if fields in PROFILE_FIELD_SETS:
+        return PROFILE_FIELD_SETS[fields]
+    
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in PROFILE_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    # consultant_id always leads so responses stay identifiable
+    return ('consultant_id',) + tuple(dict.fromkeys(field for field in requested if field != 'consultant_id'))
+
+@app.get("/consultant/{consultant_id}")
+async def get_consultant(consultant_id: str, request: Request, response: Response, fields: Optional[str] = None):
+    """Get consultant details by ID
+    
+    ``fields`` narrows the response (and the SELECT list) to a named set
+    such as ``card`` or to comma-separated column names.
+    """
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    projection = parse_profile_fields(fields)
+    etag = suggestion_service.data_version.etag()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    try:
+        consultant = await suggestion_service.get_consultant_by_id(consultant_id, projection)
     except Exception as e:
         logger.error(f"Error getting consultant {consultant_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    if not consultant:
+        raise HTTPException(status_code=404, detail="Consultant not found")
+    set_cache_headers(response, etag)
+    return consultant
 
 @app.get("/consultants/search")
-async def search_consultants_by_name(name: str, limit: int = 10):
-    """Search consultants by name (case-insensitive partial match)"""
+async def search_consultants_by_name(name: str, limit: int = 10, min_similarity: Optional[float] = None):
+    """Search consultants by name (partial match or trigram similarity)"""
     if not suggestion_service:
         raise HTTPException(status_code=500, detail="Service not initialized")
     
+    if min_similarity is not None and not 0 <= min_similarity <= 1:
+        raise HTTPException(status_code=400, detail="min_similarity must be between 0 and 1")
+    
     try:
-        consultants = suggestion_service.search_consultants_by_name(name, limit)
+        consultants = await suggestion_service.search_consultants_by_name(name, limit, min_similarity)
         return {
             "consultants": consultants,
             "total_found": len(consultants),
@@ -465,162 +1165,369 @@ async def search_consultants_by_name(name: str, limit: int = 10):
         logger.error(f"Error searching consultants by name '{name}': {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/consultants/autocomplete")
+async def autocomplete_consultant_names(prefix: str, limit: int = 10):
+    """Type-ahead on consultant names, served from the in-process prefix index"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    if not 1 <= limit <= 50:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 50")
+    
+    if not suggestion_service.name_index.is_loaded:
+        raise HTTPException(status_code=503, detail="Name index is still loading")
+    
+    start_time = time.perf_counter()
+    suggestions = suggestion_service.name_index.complete(prefix, limit)
+    return {
+        "suggestions": suggestions,
+        "prefix": prefix,
+        "lookup_ms": (time.perf_counter() - start_time) * 1000
+    }
+
+@app.get("/consultants/export")
+async def export_consultants(request: Request, format: str = "ndjson", columns: Optional[str] = None, filter_active: bool = False):
+    """Stream every consultant as NDJSON or CSV; gzip when the client accepts it
+    
+    ``columns`` is a comma-separated subset of the exportable columns.
+    """
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    
+    selected = [column.strip() for column in columns.split(",") if column.strip()] if columns else list(RESULT_COLUMNS)
+    unknown = [column for column in selected if column not in EXPORT_COLUMNS]
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown columns: {', '.join(unknown) or '(none selected)'}. Allowed: {', '.join(EXPORT_COLUMNS)}"
+        )
+    
+    body = serialize_rows(format, selected, suggestion_service.stream_consultants(selected, filter_active))
+    # The body depends on Accept-Encoding, so shared caches must key on it
+    headers = {"Content-Disposition": f"attachment; filename=consultants.{format}", "Vary": "Accept-Encoding"}
+    if accepts_gzip(request.headers.get("accept-encoding")):
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    
+    return StreamingResponse(body, media_type=EXPORT_FORMATS[format], headers=headers)
+
 @app.get("/stats")
-async def get_stats():
-    """Get database statistics"""
+async def get_stats(request: Request, response: Response):
+    """Get database statistics from the cached snapshot"""
     if not suggestion_service:
         raise HTTPException(status_code=500, detail="Service not initialized")
     
+    # Tagged with the version the snapshot was computed at, which may trail the live version
+    etag = suggestion_service.get_stats_etag()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
     try:
-        stats = suggestion_service.get_database_stats()
+        stats = await suggestion_service.get_cached_database_stats()
+        set_cache_headers(response, suggestion_service.get_stats_etag())
         return stats
         
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/stats/pool")
+async def get_pool_stats():
+    """Get database connection pool size and wait metrics"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.pool.get_stats()
+
+@app.get("/stats/embedding-cache")
+async def get_embedding_cache_stats():
+    """Get query embedding cache size and hit/miss counters"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.embedding_cache.get_stats()
+
+@app.get("/stats/embedding-provider")
+async def get_embedding_provider_stats():
+    """Get the configured embedding provider, model identifier and dimensionality"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.embedding_provider.describe()
+
+@app.get("/stats/embedding-batcher")
+async def get_embedding_batcher_stats():
+    """Get embedding request coalescing counters and batch-size/wait-time histograms"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.embedding_batcher.get_stats()
+
+@app.get("/stats/embedding-store")
+async def get_embedding_store_stats():
+    """Get persistent embedding store size"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return await suggestion_service.embedding_store.get_stats()
+
+@app.get("/stats/vector-index")
+async def get_vector_index_stats():
+    """Get in-process vector index size and load time"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    if not suggestion_service.vector_index:
+        return {"enabled": False, "search_backend": suggestion_service.search_backend}
+    return {"enabled": True, **suggestion_service.vector_index.get_stats()}
+
+@app.get("/stats/data-version")
+async def get_data_version_stats():
+    """Get the current consultant data version and when it last changed"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.data_version.get_stats()
+
+@app.get("/stats/profile-cache")
+async def get_profile_cache_stats():
+    """Get consultant profile cache size and hit rate"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.profile_cache.get_stats()
+
+@app.get("/stats/result-cache")
+async def get_result_cache_stats():
+    """Search result cache statistics"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.result_cache.get_stats()
+
+@app.get("/stats/reranker")
+async def get_reranker_stats():
+    """Rerank weights, call count and average scoring time"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.reranker.get_stats()
+
+@app.get("/stats/semantic-cache")
+async def get_semantic_cache_stats():
+    """Near-duplicate query cache statistics (hit rate and hit similarity)"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    if not suggestion_service.semantic_cache:
+        return {"enabled": False}
+    
+    return {"enabled": True, **suggestion_service.semantic_cache.get_stats()}
+
+@app.get("/stats/name-index")
+async def get_name_index_stats():
+    """Get autocomplete prefix index size and refresh counters"""
+    if not suggestion_service:
+        raise HTTPException(status_code=500, detail="Service not initialized")
+    
+    return suggestion_service.name_index.get_stats()
+
 @app.get("/consultants")
-async def get_all_consultants(limit: int = 50, offset: int = 0):
-    """Get all consultants with pagination"""
+async def get_all_consultants(request: Request, response: Response, limit: int = 50, offset: int = 0, cursor: Optional[str] = None, include_total: bool = True):
+    """Get all consultants with keyset pagination
+    
+    Follow ``next_cursor`` / ``prev_cursor`` from the previous response;
+    ``offset`` is kept for older clients and only applies without a cursor.
+    """
     if not suggestion_service:
         raise HTTPException(status_code=500, detail="Service not initialized")
     
+    if not 1 <= limit <= 500:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 500")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset must not be negative")
+    
+    etag = suggestion_service.data_version.etag()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
     try:
-        conn = psycopg2.connect(suggestion_service.postgres_url)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                consultant_id, name, email, phone, practice_area, location,
-                consultant_status, business_strategy_skills, finance_skills,
-                law_skills, marketing_pr_skills, nonprofit_skills,
-                professional_passion, projects_excite, description, keywords
-            FROM consultants 
-            ORDER BY name
-            LIMIT %s OFFSET %s
-        """, (limit, offset))
-        
-        consultants = []
-        for row in cursor.fetchall():
-            consultant = {
-                'consultant_id': row[0],
-                'name': row[1],
-                'email': row[2],
-                'phone': row[3],
-                'practice_area': row[4],
-                'location': row[5],
-                'consultant_status': row[6],
-                'business_strategy_skills': row[7],
-                'finance_skills': row[8],
-                'law_skills': row[9],
-                'marketing_pr_skills': row[10],
-                'nonprofit_skills': row[11],
-                'professional_passion': row[12],
-                'projects_excite': row[13],
-                'description': row[14],
-                'keywords': row[15]
-            }
-            consultants.append(consultant)
-        
-        cursor.close()
-        conn.close()
+        consultants, next_cursor, prev_cursor = await suggestion_service.list_consultants(limit, cursor, offset)
+        total = await suggestion_service.count_consultants() if include_total else None
+        set_cache_headers(response, etag)
         
         return {
             "consultants": consultants,
             "limit": limit,
             "offset": offset,
-            "total": len(consultants)
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+            "total": total
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PoolTimeoutError as e:
+        logger.error(f"Error getting consultants: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting consultants: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+CHAT_HELP_MESSAGE = "I'm the Canopy Assistant, specialized in helping you find the right consultants. You can ask me to find consultants with specific skills, experience, or expertise. You can also ask about specific consultants by name. For example, try asking 'Find a marketing strategy consultant', 'Who has healthcare experience?', or 'Tell me about Alex Rich'."
+
+CHAT_NAME_KEYWORDS = ["tell me about", "who is", "about", "details about", "information about"]
+
+def extract_consultant_name(query: str) -> Optional[str]:
+    """Name part of a 'tell me about ...' style query, None for skill searches"""
+    lowered = query.lower()
+    if not any(keyword in lowered for keyword in CHAT_NAME_KEYWORDS):
+        return None
+    for keyword in CHAT_NAME_KEYWORDS:
+        lowered = lowered.replace(keyword, "").strip()
+    return lowered
+
+def confident_name_match(name: str, consultants: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Top name match if it is a substring hit or similar enough to answer by name"""
+    if not consultants:
+        return None
+    consultant = consultants[0]
+    if name in (consultant['name'] or '').lower() or name in (consultant['email'] or '').lower():
+        return consultant
+    if consultant.get('name_similarity', 0) >= suggestion_service.chat_name_confidence:
+        return consultant
+    return None
+
+def format_consultant_profile(consultant: Dict[str, Any]) -> str:
+    """Markdown profile for a specific-consultant answer"""
+    response = f"Here's information about {consultant['name']}:\n\n"
+    response += f"📧 Email: {consultant['email']}\n"
+    response += f"📞 Phone: {consultant['phone']}\n"
+    response += f"📍 Location: {consultant['location']}\n"
+    response += f"🏢 Title: {consultant['title'] or 'Not specified'}\n"
+    response += f"🎯 Practice Area: {consultant['practice_area'] or 'Not specified'}\n"
+    response += f"📊 Status: {consultant['consultant_status']}\n"
+    response += f"💰 Hourly Rate: ${consultant['hourly_rate_low']} - ${consultant['hourly_rate_high']}\n\n"
+    
+    if consultant['professional_passion']:
+        response += f"💼 Professional Passion:\n{consultant['professional_passion'][:300]}...\n\n"
+    
+    if consultant['projects_excite']:
+        response += f"🚀 Projects That Excite:\n{consultant['projects_excite'][:300]}...\n\n"
+    
+    return response
+
+def format_consultant_match(position: int, consultant: Dict[str, Any]) -> str:
+    """Markdown list entry for one search match"""
+    response = f"{position}. **{consultant['name']}**\n"
+    response += f"   📧 {consultant['email']}\n"
+    response += f"   📍 {consultant['location']}\n"
+    response += f"   🎯 {consultant['practice_area'] or 'General consulting'}\n"
+    response += f"   💰 ${consultant['hourly_rate_low']} - ${consultant['hourly_rate_high']}/hour\n"
+    response += f"   📈 Match Score: {consultant['similarity_score']:.1%}\n\n"
+    return response
+
+async def chat_events(query: str):
+    """Chat answer as a sequence of (event, payload) pairs
+    
+    ``ack`` is yielded before any embedding or database work, each
+    consultant is yielded as soon as it is formatted, and ``done`` carries
+    the response type. Both /chat modes are built from this sequence.
+    """
+    yield "ack", {"query": query}
+    
+    if not query:
+        yield "delta", {"text": CHAT_HELP_MESSAGE}
+        yield "done", {"type": "general"}
+        return
+    
+    name = extract_consultant_name(query)
+    if name:
+        # Keywords like "about" also appear in skill queries ("who knows about
+        # healthcare"), so run the name lookup and the semantic search side by
+        # side: a confident name match wins and the search is cancelled,
+        # otherwise the search results are already in flight.
+        name_task = asyncio.create_task(suggestion_service.search_consultants_by_name(name, limit=5))
+        search_task = asyncio.create_task(suggestion_service.search_consultants(query, limit=5))
+        try:
+            consultant = confident_name_match(name, await name_task)
+            if consultant:
+                search_task.cancel()
+                yield "consultant", {"text": format_consultant_profile(consultant), "consultant": consultant}
+                yield "delta", {"text": "Would you like to see more details or contact this consultant?"}
+                yield "done", {"type": "specific_consultant"}
+                return
+            consultants = await search_task
+        finally:
+            for task in (name_task, search_task):
+                if not task.done():
+                    task.cancel()
+        if not consultants:
+            yield "delta", {"text": f"I couldn't find a consultant named '{name}'. Please check the spelling or try searching for consultants with specific skills instead."}
+            yield "done", {"type": "not_found"}
+            return
+    else:
+        # Regular skill/expertise search
+        consultants = await suggestion_service.search_consultants(query, limit=5)
+    
+    if consultants:
+        yield "delta", {"text": f"I found {len(consultants)} consultant(s) matching your query '{query}':\n\n"}
+        for i, consultant in enumerate(consultants, 1):
+            yield "consultant", {"text": format_consultant_match(i, consultant), "consultant": consultant}
+        yield "delta", {"text": "Would you like more details about any of these consultants?"}
+        yield "done", {"type": "search_results"}
+    else:
+        yield "delta", {"text": f"I couldn't find any consultants matching '{query}'. Try searching for specific skills like 'marketing', 'finance', 'healthcare', or 'leadership'."}
+        yield "done", {"type": "no_results"}
+
+async def chat_event_stream(query: str):
+    """Server-sent events for chat_events; errors become an ``error`` event"""
+    try:
+        async for event, payload in chat_events(query):
+            yield f"event: {event}\ndata: ".encode("utf-8") + dumps(payload) + b"\n\n"
+    except Exception as e:
+        logger.error(f"Error in chat stream: {e}")
+        yield b"event: error\ndata: " + dumps({"detail": str(e)}) + b"\n\n"
+
 @app.post("/chat")
-async def chat_endpoint(request: dict):
-    """Chat endpoint that handles both name searches and general queries"""
+async def chat_endpoint(request: dict, http_request: Request):
+    """Chat endpoint that handles both name searches and general queries
+    
+    Send ``"stream": true`` or ``Accept: text/event-stream`` to receive
+    server-sent events (ack, delta, consultant, done) instead of one JSON body.
+    """
     if not suggestion_service:
         raise HTTPException(status_code=500, detail="Service not initialized")
     
+    query = request.get("message", "").strip()
+    
+    if request.get("stream") or "text/event-stream" in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            chat_event_stream(query),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
     try:
-        query = request.get("message", "").strip()
-        if not query:
-            return {
-                "response": "I'm the Canopy Assistant, specialized in helping you find the right consultants. You can ask me to find consultants with specific skills, experience, or expertise. You can also ask about specific consultants by name. For example, try asking 'Find a marketing strategy consultant', 'Who has healthcare experience?', or 'Tell me about Alex Rich'.",
-                "consultants": [],
-                "type": "general"
-            }
+        response, consultants, response_type = "", [], "general"
+        async for event, payload in chat_events(query):
+            if event in ("delta", "consultant"):
+                response += payload["text"]
+            if event == "consultant":
+                consultants.append(payload["consultant"])
+            elif event == "done":
+                response_type = payload["type"]
         
-        # Check if query is asking about a specific consultant by name
-        name_keywords = ["tell me about", "who is", "about", "details about", "information about"]
-        is_name_query = any(keyword in query.lower() for keyword in name_keywords)
-        
-        if is_name_query:
-            # Extract name from query
-            name = query.lower()
-            for keyword in name_keywords:
-                name = name.replace(keyword, "").strip()
-            
-            # Search for consultant by name
-            consultants = suggestion_service.search_consultants_by_name(name, limit=5)
-            
-            if consultants:
-                consultant = consultants[0]  # Get the first match
-                response = f"Here's information about {consultant['name']}:\n\n"
-                response += f"📧 Email: {consultant['email']}\n"
-                response += f"📞 Phone: {consultant['phone']}\n"
-                response += f"📍 Location: {consultant['location']}\n"
-                response += f"🏢 Title: {consultant['title'] or 'Not specified'}\n"
-                response += f"🎯 Practice Area: {consultant['practice_area'] or 'Not specified'}\n"
-                response += f"📊 Status: {consultant['consultant_status']}\n"
-                response += f"💰 Hourly Rate: ${consultant['hourly_rate_low']} - ${consultant['hourly_rate_high']}\n\n"
-                
-                if consultant['professional_passion']:
-                    response += f"💼 Professional Passion:\n{consultant['professional_passion'][:300]}...\n\n"
-                
-                if consultant['projects_excite']:
-                    response += f"🚀 Projects That Excite:\n{consultant['projects_excite'][:300]}...\n\n"
-                
-                response += "Would you like to see more details or contact this consultant?"
-                
-                return {
-                    "response": response,
-                    "consultants": [consultant],
-                    "type": "specific_consultant"
-                }
-            else:
-                return {
-                    "response": f"I couldn't find a consultant named '{name}'. Please check the spelling or try searching for consultants with specific skills instead.",
-                    "consultants": [],
-                    "type": "not_found"
-                }
-        
-        # Regular skill/expertise search
-        consultants = suggestion_service.search_consultants(query, limit=5)
-        
-        if consultants:
-            response = f"I found {len(consultants)} consultant(s) matching your query '{query}':\n\n"
-            for i, consultant in enumerate(consultants, 1):
-                response += f"{i}. **{consultant['name']}**\n"
-                response += f"   📧 {consultant['email']}\n"
-                response += f"   📍 {consultant['location']}\n"
-                response += f"   🎯 {consultant['practice_area'] or 'General consulting'}\n"
-                response += f"   💰 ${consultant['hourly_rate_low']} - ${consultant['hourly_rate_high']}/hour\n"
-                response += f"   📈 Match Score: {consultant['similarity_score']:.1%}\n\n"
-            
-            response += "Would you like more details about any of these consultants?"
-            
-            return {
-                "response": response,
-                "consultants": consultants,
-                "type": "search_results"
-            }
-        else:
-            return {
-                "response": f"I couldn't find any consultants matching '{query}'. Try searching for specific skills like 'marketing', 'finance', 'healthcare', or 'leadership'.",
-                "consultants": [],
-                "type": "no_results"
-            }
+        return {
+            "response": response,
+            "consultants": consultants,
+            "type": response_type
+        }
             
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}")
@@ -631,7 +1538,14 @@ if __name__ == "__main__":
     print("=" * 45)
     
     if suggestion_service:
-        stats = suggestion_service.get_database_stats()
+        async def startup_stats():
+            # Runs on a throwaway loop, so release the pool before uvicorn starts its own
+            try:
+                return await suggestion_service.get_database_stats()
+            finally:
+                await suggestion_service.pool.close()
+        
+        stats = asyncio.run(startup_stats())
         print(f"📊 Database Status:")
         print(f"   Total consultants: {stats.get('total_consultants', 0)}")
         print(f"   With embeddings: {stats.get('with_embeddings', 0)}")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Consultant Data Version
+Monotonically increasing version of the consultants table, read from the
+single-row data_version table that a statement-level trigger bumps on
+every write (see etl/check_schema.py). Caches key their entries on it so
+they go stale the moment a sync lands.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_VERSION_SQL = "SELECT version FROM data_version"
+
+# Fallback when the trigger table has not been created yet
+_SIGNATURE_SQL = "SELECT COUNT(*), MAX(extracted_at), MAX(modified_time) FROM consultants"
+
+
+class DataVersion:
+    """Polls the database for the current data version
+
+    Without the data_version table the version is a local counter bumped
+    whenever the table signature changes, monotonic within this process.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.version: Optional[int] = None
+        self.changed_at: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.source: Optional[str] = None
+        self._signature = None
+        # Local counters restart at 1, so their ETags must not collide across restarts
+        self._process_tag = uuid.uuid4().hex[:8]
+        self._refresh_lock = asyncio.Lock()
+
+    async def _read(self):
+        async with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                await cursor.execute(_VERSION_SQL)
+                row = await cursor.fetchone()
+                if row is not None:
+                    return 'trigger', int(row[0])
+            except Exception as e:
+                logger.warning(f"⚠️ data_version table unavailable, using table signature: {e}")
+                await conn.rollback()
+            await cursor.execute(_SIGNATURE_SQL)
+            row = await cursor.fetchone()
+            await cursor.close()
+        return 'signature', tuple(row)
+
+    async def refresh(self) -> bool:
+        """Re-read the version; returns True when it changed"""
+        async with self._refresh_lock:
+            source, token = await self._read()
+            self.checked_at = time.time()
+
+            if source == 'trigger':
+                version = token
+            elif token == self._signature and self.version is not None:
+                version = self.version
+            else:
+                version = (self.version or 0) + 1
+            self._signature = token if source == 'signature' else None
+            self.source = source
+
+            if version == self.version:
+                return False
+            if self.version is not None:
+                logger.info(f"🔄 Consultant data changed (version {self.version} -> {version})")
+            self.version = version
+            self.changed_at = self.checked_at
+            return True
+
+    async def current(self) -> int:
+        """Last polled version, reading it once if nothing has been polled yet"""
+        if self.version is None:
+            await self.refresh()
+        return self.version
+
+    async def run_refresh_loop(self, interval: float):
+        """Poll for data changes in the background"""
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error polling data version: {e}")
+            await asyncio.sleep(interval)
+
+    def etag(self, version: Optional[int] = None) -> Optional[str]:
+        """Strong ETag for content derived from ``version`` (default: the last polled version)"""
+        version = self.version if version is None else version
+        if version is None:
+            return None
+        if self.source == 'signature':
+            return f'"{self._process_tag}-{version}"'
+        return f'"v{version}"'
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'source': self.source,
+            'changed_at': self.changed_at,
+            'checked_at': self.checked_at,
+        }
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+Database Connection Pools
+Managed connection pools with checkout health checks, connection recycling
+and pool-wait metrics:
+- ConnectionPool: thread-safe psycopg2 pool for the synchronous ETL scripts
+- AsyncConnectionPool: asyncio-native psycopg 3 pool for the FastAPI service
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Optional
+
+import psycopg2
+import psycopg2.extensions
+
+try:
+    import psycopg
+    from psycopg import pq
+except ImportError:  # only the async pool needs psycopg 3
+    psycopg = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available within the pool timeout"""
+
+
+class _PooledConnection:
+    """A connection plus the bookkeeping needed to decide when to recycle it"""
+
+    __slots__ = ("conn", "created_at", "last_used_at", "uses")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+        self.uses = 0
+
+
+class ConnectionPool:
+    """Thread-safe psycopg2 connection pool
+
+    - keeps between ``min_size`` and ``max_size`` connections open
+    - validates connections on checkout (closed check, plus ``SELECT 1`` when
+      the connection has been idle longer than ``health_check_interval``)
+    - recycles connections after ``max_uses`` checkouts or ``max_lifetime`` seconds
+    - records how long callers wait for a connection
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_uses: int = 1000,
+        max_lifetime: float = 1800.0,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min_size={min_size}, max_size={max_size}")
+
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle: deque = deque()
+        self._size = 0  # open connections, idle + checked out
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._metrics = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'connections_created': 0,
+            'connections_recycled': 0,
+            'health_check_failures': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+        }
+
+        self._prefill()
+
+    @classmethod
+    def from_env(cls, dsn: str) -> "ConnectionPool":
+        """ETL pool sized by the POSTGRES_POOL_* settings shared with the API"""
+        return cls(
+            dsn,
+            min_size=1,
+            max_size=int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+            max_uses=int(os.getenv("POSTGRES_POOL_MAX_USES", "1000")),
+            max_lifetime=float(os.getenv("POSTGRES_POOL_MAX_LIFETIME", "1800")),
+            timeout=float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+        )
+
+    def _prefill(self):
+        """Open ``min_size`` connections up front so the first requests don't pay for them"""
+        for _ in range(self.min_size):
+            try:
+                entry = self._create()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not pre-open pooled connection: {e}")
+                return
+            with self._cond:
+                self._size += 1
+                self._idle.append(entry)
+
+    def _create(self) -> _PooledConnection:
+        conn = psycopg2.connect(self.dsn)
+        with self._cond:
+            self._metrics['connections_created'] += 1
+        return _PooledConnection(conn)
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_expired(self, entry: _PooledConnection) -> bool:
+        if self.max_uses and entry.uses >= self.max_uses:
+            return True
+        if self.max_lifetime and time.monotonic() - entry.created_at >= self.max_lifetime:
+            return True
+        return False
+
+    def _is_healthy(self, entry: _PooledConnection) -> bool:
+        if entry.conn.closed:
+            return False
+        if time.monotonic() - entry.last_used_at < self.health_check_interval:
+            return True
+        try:
+            cursor = entry.conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            entry.conn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Pooled connection failed health check: {e}")
+            return False
+
+    def getconn(self) -> _PooledConnection:
+        """Check a connection out of the pool, opening one if below ``max_size``"""
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+        entry: Optional[_PooledConnection] = None
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolTimeoutError("Connection pool is closed")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1  # reserve the slot, connect outside the lock
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._metrics['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available after {self.timeout:.1f}s "
+                        f"(max_size={self.max_size})"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+        try:
+            if entry is not None and self._is_expired(entry):
+                self._close_quietly(entry.conn)
+                entry = None
+                with self._cond:
+                    self._metrics['connections_recycled'] += 1
+            elif entry is not None and not self._is_healthy(entry):
+                self._close_quietly(entry.conn)
+                entry = None
+                with self._cond:
+                    self._metrics['health_check_failures'] += 1
+            if entry is None:
+                entry = self._create()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        entry.uses += 1
+        wait_time = time.monotonic() - start
+        with self._cond:
+            self._metrics['checkouts'] += 1
+            self._metrics['wait_time_total'] += wait_time
+            if waited:
+                self._metrics['waits'] += 1
+            if wait_time > self._metrics['wait_time_max']:
+                self._metrics['wait_time_max'] = wait_time
+        return entry
+
+    def putconn(self, entry: _PooledConnection, discard: bool = False):
+        """Return a connection to the pool, rolling back any open transaction"""
+        conn = entry.conn
+        if not discard and not conn.closed:
+            try:
+                if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._cond:
+            if discard or conn.closed or self._closed:
+                self._size -= 1
+                self._close_quietly(conn)
+            else:
+                entry.last_used_at = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a ``with`` block"""
+        entry = self.getconn()
+        discard = False
+        try:
+            yield entry.conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            discard = True
+            raise
+        finally:
+            self.putconn(entry, discard=discard)
+
+    def close(self):
+        """Close every idle connection; checked-out ones are closed when returned"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                entry = self._idle.pop()
+                self._size -= 1
+                self._close_quietly(entry.conn)
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size and wait metrics"""
+        with self._cond:
+            stats = dict(self._metrics)
+            idle = len(self._idle)
+            stats.update({
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': self._size,
+                'idle': idle,
+                'in_use': self._size - idle,
+            })
+        checkouts = stats['checkouts']
+        stats['wait_time_avg'] = stats['wait_time_total'] / checkouts if checkouts else 0.0
+        return stats
+
+
+class AsyncConnectionPool:
+    """asyncio-native psycopg 3 connection pool
+
+    Same sizing, recycling, health-check and metrics semantics as
+    ``ConnectionPool``, but waiting for a connection suspends the coroutine
+    instead of blocking the event loop. Call ``await pool.open()`` from the
+    event loop that will use the pool.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_uses: int = 1000,
+        max_lifetime: float = 1800.0,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+    ):
+        if psycopg is None:
+            raise ImportError("psycopg (v3) is required for AsyncConnectionPool")
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min_size={min_size}, max_size={max_size}")
+
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle: deque = deque()
+        self._size = 0
+        self._closed = True
+        self._cond: Optional[asyncio.Condition] = None
+
+        self._metrics = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'connections_created': 0,
+            'connections_recycled': 0,
+            'health_check_failures': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+        }
+
+    async def open(self):
+        """Bind the pool to the running loop and open ``min_size`` connections"""
+        self._cond = asyncio.Condition()
+        self._closed = False
+        for _ in range(self.min_size - self._size):
+            try:
+                entry = await self._create()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not pre-open pooled connection: {e}")
+                return
+            self._size += 1
+            self._idle.append(entry)
+
+    async def _create(self) -> _PooledConnection:
+        conn = await psycopg.AsyncConnection.connect(self.dsn)
+        self._metrics['connections_created'] += 1
+        return _PooledConnection(conn)
+
+    @staticmethod
+    async def _close_quietly(conn):
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+    def _is_expired(self, entry: _PooledConnection) -> bool:
+        if self.max_uses and entry.uses >= self.max_uses:
+            return True
+        if self.max_lifetime and time.monotonic() - entry.created_at >= self.max_lifetime:
+            return True
+        return False
+
+    async def _is_healthy(self, entry: _PooledConnection) -> bool:
+        if entry.conn.closed:
+            return False
+        if time.monotonic() - entry.last_used_at < self.health_check_interval:
+            return True
+        try:
+            await entry.conn.execute("SELECT 1")
+            await entry.conn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Pooled connection failed health check: {e}")
+            return False
+
+    async def getconn(self) -> _PooledConnection:
+        """Check a connection out of the pool, opening one if below ``max_size``"""
+        if self._cond is None:
+            await self.open()
+
+        start = time.monotonic()
+        waited = False
+        entry: Optional[_PooledConnection] = None
+
+        async with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolTimeoutError("Connection pool is closed")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1  # reserve the slot, connect outside the lock
+                    break
+                remaining = start + self.timeout - time.monotonic()
+                if remaining <= 0:
+                    self._metrics['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available after {self.timeout:.1f}s "
+                        f"(max_size={self.max_size})"
+                    )
+                waited = True
+                try:
+                    await asyncio.wait_for(self._cond.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+        try:
+            if entry is not None and self._is_expired(entry):
+                await self._close_quietly(entry.conn)
+                entry = None
+                self._metrics['connections_recycled'] += 1
+            elif entry is not None and not await self._is_healthy(entry):
+                await self._close_quietly(entry.conn)
+                entry = None
+                self._metrics['health_check_failures'] += 1
+            if entry is None:
+                entry = await self._create()
+        except BaseException:
+            async with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        entry.uses += 1
+        wait_time = time.monotonic() - start
+        self._metrics['checkouts'] += 1
+        self._metrics['wait_time_total'] += wait_time
+        if waited:
+            self._metrics['waits'] += 1
+        if wait_time > self._metrics['wait_time_max']:
+            self._metrics['wait_time_max'] = wait_time
+        return entry
+
+    async def putconn(self, entry: _PooledConnection, discard: bool = False):
+        """Return a connection to the pool, rolling back any open transaction"""
+        conn = entry.conn
+        if not discard and not conn.closed:
+            try:
+                if conn.info.transaction_status != pq.TransactionStatus.IDLE:
+                    await conn.rollback()
+            except Exception:
+                discard = True
+
+        async with self._cond:
+            if discard or conn.closed or self._closed:
+                self._size -= 1
+                await self._close_quietly(conn)
+            else:
+                entry.last_used_at = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+
+    @asynccontextmanager
+    async def connection(self):
+        """Borrow a connection for the duration of an ``async with`` block"""
+        entry = await self.getconn()
+        discard = False
+        try:
+            yield entry.conn
+        except (psycopg.OperationalError, psycopg.InterfaceError, asyncio.CancelledError):
+            # a cancelled query leaves the connection in an unknown state
+            discard = True
+            raise
+        finally:
+            await self.putconn(entry, discard=discard)
+
+    async def close(self):
+        """Close every idle connection; checked-out ones are closed when returned"""
+        self._closed = True
+        if self._cond is None:
+            return
+        async with self._cond:
+            while self._idle:
+                entry = self._idle.pop()
+                self._size -= 1
+                await self._close_quietly(entry.conn)
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size and wait metrics"""
+        stats = dict(self._metrics)
+        idle = len(self._idle)
+        stats.update({
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'size': self._size,
+            'idle': idle,
+            'in_use': self._size - idle,
+        })
+        checkouts = stats['checkouts']
+        stats['wait_time_avg'] = stats['wait_time_total'] / checkouts if checkouts else 0.0
+        return stats
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Embedding Request Batcher
+Coalesces concurrent query embedding requests: texts arriving within a
+short window are sent as one list-input embeddings call, and identical
+texts already in flight share a single future (singleflight) instead of
+being embedded twice. A batch rejected because of its input is split in
+half and each half retried, so one bad input (e.g. an over-long query) fails
+only its own waiters; any other failure (rate limit, timeout, outage) fails
+the whole batch at once rather than multiplying calls to a struggling provider.
+"""
+
+import asyncio
+import bisect
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Returns {text: embedding} for the texts it could embed
+EmbedMany = Callable[[List[str]], Awaitable[Dict[str, List[float]]]]
+# True when an error was caused by one of the inputs rather than the provider
+IsInputError = Callable[[Exception], bool]
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+WAIT_TIME_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+
+class Histogram:
+    """Per-bucket (non-cumulative) counts with inclusive upper bounds, plus an overflow bucket"""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound:g}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'buckets': buckets,
+        }
+
+
+class EmbeddingBatcher:
+    """Micro-batching dispatcher in front of a list-input embeddings call
+
+    Must be used from a single event loop; futures are created lazily so the
+    batcher can be constructed before the loop starts.
+    """
+
+    def __init__(self, embed_many: EmbedMany, window: float = 0.005, max_batch_size: int = 256,
+                 is_input_error: Optional[IsInputError] = None):
+        if window < 0:
+            raise ValueError(f"Invalid window: {window}")
+        if max_batch_size < 1:
+            raise ValueError(f"Invalid max_batch_size: {max_batch_size}")
+
+        self.embed_many = embed_many
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.is_input_error = is_input_error
+
+        self._pending: List[Tuple[str, float]] = []
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+        self.requests = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.errors = 0
+        self.splits = 0
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.wait_times_ms = Histogram(WAIT_TIME_BUCKETS_MS)
+
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Embedding for ``text``, batched with concurrent callers
+
+        Cancelling the caller does not cancel the shared request.
+        """
+        self.requests += 1
+        future = self._in_flight.get(text)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._in_flight[text] = future
+            self._pending.append((text, time.perf_counter()))
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending[:self.max_batch_size], self._pending[self.max_batch_size:]
+        if self._pending:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self._flush)
+        if not batch:
+            return
+
+        sent_at = time.perf_counter()
+        self.batches += 1
+        self.batch_sizes.observe(len(batch))
+        for _, queued_at in batch:
+            self.wait_times_ms.observe((sent_at - queued_at) * 1000)
+
+        # Keep a reference so the task is not garbage-collected mid-call
+        task = asyncio.ensure_future(self._dispatch([text for text, _ in batch]))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel(self, texts: List[str]):
+        # Loop shutdown: release the waiters rather than leave them hanging
+        for text in texts:
+            future = self._in_flight.pop(text, None)
+            if future is not None:
+                future.cancel()
+
+    async def _dispatch(self, texts: List[str]):
+        try:
+            embeddings = await self.embed_many(texts)
+        except asyncio.CancelledError:
+            self._cancel(texts)
+            raise
+        except Exception as e:
+            self.errors += 1
+            if len(texts) > 1 and self.is_input_error is not None and self.is_input_error(e):
+                # Bisect down to the rejected input instead of failing every waiter
+                self.splits += 1
+                middle = len(texts) // 2
+                try:
+                    await asyncio.gather(self._dispatch(texts[:middle]), self._dispatch(texts[middle:]))
+                except asyncio.CancelledError:
+                    self._cancel(texts)
+                    raise
+                return
+            for text in texts:
+                future = self._in_flight.pop(text)
+                if not future.done():
+                    future.set_exception(e)
+                # Waiters that were cancelled never retrieve it; don't log it as unhandled
+                future.exception()
+            return
+        for text in texts:
+            future = self._in_flight.pop(text)
+            if not future.done():
+                future.set_result(embeddings.get(text))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request, coalescing and batch counters with batch-size and wait-time histograms"""
+        return {
+            'window_ms': self.window * 1000,
+            'max_batch_size': self.max_batch_size,
+            'requests': self.requests,
+            'coalesced': self.coalesced,
+            'batches': self.batches,
+            'errors': self.errors,
+            'splits': self.splits,
+            'pending': len(self._pending),
+            'in_flight': len(self._in_flight),
+            'batch_size': self.batch_sizes.to_dict(),
+            'wait_time_ms': self.wait_times_ms.to_dict(),
+        }
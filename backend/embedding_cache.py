@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Query Embedding Cache
+Bounded in-process LRU cache with TTL for query embeddings, keyed on
+embedding model and the exact query text that was embedded
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class EmbeddingCache:
+    """LRU + TTL cache of query embeddings
+
+    Entries older than ``ttl`` seconds are treated as misses and dropped;
+    once ``max_entries`` is reached the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 86400.0):
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(model: str, text: str) -> Tuple[str, str]:
+        return (model, text)
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Return the cached embedding, or None on a miss or expired entry"""
+        key = self.make_key(model, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, embedding = entry
+            if self.ttl and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def put(self, model: str, text: str, embedding: List[float]):
+        """Store an embedding, evicting the least recently used entries if full"""
+        key = self.make_key(model, text)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Embedding Providers
+One interface for every component that turns text into vectors (API query
+embedding, Zoho ETL, JSON migration), selected with EMBEDDING_PROVIDER:
+- openai: OpenAI embeddings API (default, text-embedding-ada-002)
+- local: ONNX sentence encoder (optionally quantized) run on CPU in a
+  thread pool; needs onnxruntime and tokenizers
+- hashing: deterministic feature-hashing vectors for offline tests and
+  benchmarks; no network, no model files
+
+``model`` is the identifier stored next to each vector (embedding store
+keys, consultants.embedding_model) and ``dimensions`` its vector size.
+"""
+
+import abc
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import openai
+
+try:
+    import onnxruntime
+    from tokenizers import Tokenizer
+except ImportError:  # pragma: no cover - only needed for the local provider
+    onnxruntime = None
+    Tokenizer = None
+
+# Output sizes of the OpenAI embedding models (text-embedding-3-* default sizes)
+OPENAI_DIMENSIONS = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+}
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Character cap on texts sent for embedding (ada-002 accepts ~8192 tokens, roughly 6000 chars)
+MAX_EMBEDDING_CHARS = 6000
+
+
+class EmbeddingProvider(abc.ABC):
+    """Text to vectors; subclasses implement ``embed`` and may override ``aembed``"""
+
+    model: str
+    dimensions: int
+
+    @abc.abstractmethod
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """One vector per input text, in input order"""
+
+    async def aembed(self, texts: List[str]) -> List[List[float]]:
+        """``embed`` without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.embed, texts)
+
+    def is_input_error(self, error: Exception) -> bool:
+        """True when ``error`` rejects the input texts, so a smaller batch may succeed"""
+        return isinstance(error, ValueError)
+
+    def describe(self) -> dict:
+        return {'provider': type(self).__name__, 'model': self.model, 'dimensions': self.dimensions}
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """OpenAI embeddings API; list inputs are sent as a single request"""
+
+    def __init__(self, api_key: str, model: str = "text-embedding-ada-002"):
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not found in .env file")
+        if model not in OPENAI_DIMENSIONS:
+            raise ValueError(f"Unknown OpenAI embedding model: {model}")
+
+        self.model = model
+        self.dimensions = OPENAI_DIMENSIONS[model]
+        self.client = openai.OpenAI(api_key=api_key)
+        self.async_client = openai.AsyncOpenAI(api_key=api_key)
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        response = self.client.embeddings.create(model=self.model, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def aembed(self, texts: List[str]) -> List[List[float]]:
+        response = await self.async_client.embeddings.create(model=self.model, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    def is_input_error(self, error: Exception) -> bool:
+        # 400s (e.g. a text over the token limit); rate limits, timeouts and 5xx are not
+        return isinstance(error, (openai.BadRequestError, ValueError))
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """Sentence encoder exported to ONNX, run on CPU
+
+    ``model_dir`` holds the ONNX graph and the Hugging Face tokenizer.json
+    (e.g. an Optimum export of all-MiniLM-L6-v2; point ``model_file`` at
+    model_quantized.onnx for the int8 variant). Token embeddings are
+    mean-pooled over the attention mask and L2-normalized. The session is
+    loaded once; async calls run on a dedicated thread pool.
+    """
+
+    def __init__(self, model_dir: str, model_file: str = "model.onnx", threads: int = 2, max_length: int = 256):
+        if onnxruntime is None or Tokenizer is None:
+            raise ImportError("The local embedding provider needs onnxruntime and tokenizers installed")
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = threads
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, model_file), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+
+        self.model = f"local:{os.path.basename(os.path.normpath(model_dir))}/{model_file}"
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="embedding")
+
+        output_size = self.session.get_outputs()[0].shape[-1]
+        self.dimensions = output_size if isinstance(output_size, int) else len(self.embed(["dimension probe"])[0])
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([encoding.ids for encoding in encodings], dtype=np.int64)
+        attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        output = self.session.run(None, feeds)[0]
+
+        if output.ndim == 3:
+            # (batch, tokens, dim) token embeddings: mean over real tokens
+            mask = attention_mask[:, :, None].astype(np.float32)
+            output = (output * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        norms = np.linalg.norm(output, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (output / norms).astype(np.float32).tolist()
+
+    async def aembed(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.embed, texts)
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """Deterministic signed feature hashing of word unigrams and bigrams
+
+    The same text always maps to the same unit vector on every machine, and
+    texts sharing words have positive cosine similarity, which is enough to
+    exercise search, caching and benchmarks without an API key.
+    """
+
+    def __init__(self, dimensions: int = 1536):
+        if dimensions < 1:
+            raise ValueError(f"Invalid dimensions: {dimensions}")
+
+        self.dimensions = dimensions
+        self.model = f"hashing-{dimensions}"
+
+    def _vector(self, text: str) -> List[float]:
+        tokens = _TOKEN_PATTERN.findall(text.casefold())
+        features = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            index = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[index] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector.tolist()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self._vector(text) for text in texts]
+
+    async def aembed(self, texts: List[str]) -> List[List[float]]:
+        # Microseconds per text; not worth a thread hop
+        return self.embed(texts)
+
+
+def embed_with_retry(provider: EmbeddingProvider, text: str, max_retries: int = 3) -> Optional[List[float]]:
+    """Embed one text for the ETL, backing off exponentially; None once retries are exhausted"""
+    for attempt in range(max_retries):
+        try:
+            return provider.embed([text])[0]
+        except Exception as e:
+            if attempt < max_retries - 1:
+                wait_time = 2 ** attempt  # Exponential backoff
+                logger.warning(f"Embedding provider error (attempt {attempt + 1}), retrying in {wait_time}s: {e}")
+                time.sleep(wait_time)
+            else:
+                logger.error(f"Embedding provider failed after {max_retries} attempts: {e}")
+    return None
+
+
+def create_embedding_provider(name: Optional[str] = None) -> EmbeddingProvider:
+    """Provider selected by ``name`` or EMBEDDING_PROVIDER, configured from the environment"""
+    name = (name or os.getenv("EMBEDDING_PROVIDER", "openai")).lower()
+    if name == "openai":
+        return OpenAIEmbeddingProvider(
+            os.getenv("OPENAI_API_KEY"),
+            model=os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002"),
+        )
+    if name == "local":
+        model_dir = os.getenv("LOCAL_EMBEDDING_MODEL_DIR")
+        if not model_dir:
+            raise ValueError("LOCAL_EMBEDDING_MODEL_DIR is required for the local embedding provider")
+        return LocalEmbeddingProvider(
+            model_dir,
+            model_file=os.getenv("LOCAL_EMBEDDING_MODEL_FILE", "model.onnx"),
+            threads=int(os.getenv("LOCAL_EMBEDDING_THREADS", "2")),
+        )
+    if name == "hashing":
+        return HashingEmbeddingProvider(int(os.getenv("EMBEDDING_DIMENSIONS", "1536")))
+    raise ValueError(f"Unknown EMBEDDING_PROVIDER: {name}")
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Persistent Embedding Store
+Content-addressed, Postgres-backed store of embeddings keyed by
+sha256(model, text), shared by the ETL scripts and the API so unchanged
+text is never embedded twice.
+- EmbeddingStore: synchronous, borrows from db_pool.ConnectionPool (ETL)
+- AsyncEmbeddingStore: asyncio-native, borrows from db_pool.AsyncConnectionPool (API)
+"""
+
+import hashlib
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from psycopg2.extras import execute_values
+
+logger = logging.getLogger(__name__)
+
+# Rows ranked by recency; anything past the entry or byte budget is pruned
+_PRUNE_SQL = """
+    DELETE FROM embedding_store
+    WHERE content_hash IN (
+        SELECT content_hash FROM (
+            SELECT
+                content_hash,
+                ROW_NUMBER() OVER (ORDER BY last_used_at DESC) AS recency_rank,
+                SUM(pg_column_size(embedding)) OVER (ORDER BY last_used_at DESC) AS running_bytes
+            FROM embedding_store
+        ) ranked
+        WHERE recency_rank > %s OR running_bytes > %s
+    )
+"""
+
+# Fetch hits and bump their recency in one round-trip
+_GET_SQL = """
+    UPDATE embedding_store
+    SET last_used_at = CURRENT_TIMESTAMP
+    WHERE content_hash = ANY(%s)
+    RETURNING content_hash, embedding
+"""
+
+_PUT_SQL = """
+    INSERT INTO embedding_store (content_hash, model, dimensions, embedding)
+    VALUES {values}
+    ON CONFLICT (content_hash) DO UPDATE SET last_used_at = CURRENT_TIMESTAMP
+"""
+
+_STATS_SQL = """
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(pg_column_size(embedding)), 0),
+        pg_total_relation_size('embedding_store')
+    FROM embedding_store
+"""
+
+# Large enough to never trigger when a budget is not set
+_UNLIMITED = 2 ** 62
+
+
+def content_hash(model: str, text: str) -> str:
+    """Stable key for an embedding of ``text`` produced by ``model``"""
+    return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+
+def _hash_texts(model: str, texts: Iterable[str]) -> Dict[str, str]:
+    return {content_hash(model, text): text for text in texts if text}
+
+
+def _stats_row_to_dict(row) -> Dict[str, Any]:
+    return {
+        'entries': row[0],
+        'embedding_bytes': row[1],
+        'table_bytes': row[2],
+    }
+
+
+class EmbeddingStore:
+    """Synchronous embedding store for the ETL scripts
+
+    Failures are logged and treated as misses so a missing or unreachable
+    store never blocks embedding generation.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def get_many(self, model: str, texts: Iterable[str]) -> Dict[str, List[float]]:
+        """Return stored embeddings for ``texts``, keyed by text; misses are omitted"""
+        hashed = _hash_texts(model, texts)
+        if not hashed:
+            return {}
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_GET_SQL, (list(hashed),))
+                rows = cursor.fetchall()
+                conn.commit()
+                cursor.close()
+            return {hashed[key]: list(embedding) for key, embedding in rows}
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding store lookup failed: {e}")
+            return {}
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        return self.get_many(model, [text]).get(text)
+
+    def put_many(self, model: str, embeddings: Dict[str, List[float]]):
+        """Store embeddings keyed by the text they were generated from"""
+        rows = [
+            (content_hash(model, text), model, len(embedding), list(embedding))
+            for text, embedding in embeddings.items()
+            if text and embedding
+        ]
+        if not rows:
+            return
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                execute_values(cursor, _PUT_SQL.format(values="%s"), rows)
+                conn.commit()
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding store write failed: {e}")
+
+    def put(self, model: str, text: str, embedding: List[float]):
+        self.put_many(model, {text: embedding})
+
+    def get_or_embed(self, model: str, texts: List[str],
+                     embed: Callable[[str], Optional[List[float]]]) -> List[Optional[List[float]]]:
+        """Embeddings for ``texts`` in input order, calling ``embed`` once per distinct stored miss
+
+        New embeddings are written back in one batch. Each store round-trip
+        borrows its own pooled connection, so callers should not hold one.
+        """
+        stored = self.get_many(model, texts)
+        generated: Dict[str, List[float]] = {}
+        for text in texts:
+            if text and text not in stored and text not in generated:
+                embedding = embed(text)
+                if embedding:
+                    generated[text] = embedding
+
+        self.put_many(model, generated)
+        return [stored.get(text) or generated.get(text) for text in texts]
+
+    def prune(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently used embeddings beyond the entry/byte budgets"""
+        if not max_entries and not max_bytes:
+            return 0
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_PRUNE_SQL, (max_entries or _UNLIMITED, max_bytes or _UNLIMITED))
+                deleted = cursor.rowcount
+                conn.commit()
+                cursor.close()
+            if deleted:
+                logger.info(f"🧹 Pruned {deleted} embeddings from the embedding store")
+            return deleted
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding store prune failed: {e}")
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count and size accounting"""
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_STATS_SQL)
+                row = cursor.fetchone()
+                cursor.close()
+            return _stats_row_to_dict(row)
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding store stats failed: {e}")
+            return {}
+
+
+class AsyncEmbeddingStore:
+    """asyncio-native embedding store for the API, same semantics as ``EmbeddingStore``"""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def get_many(self, model: str, texts: Iterable[str]) -> Dict[str, List[float]]:
+        """Return stored embeddings for ``texts``, keyed by text; misses are omitted"""
+        hashed = _hash_texts(model, texts)
+        if not hashed:
+            return {}
+        try:
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                await cursor.execute(_GET_SQL, (list(hashed),))
+                rows = await cursor.fetchall()
+                await conn.commit()
+                await cursor.close()
+            return {hashed[key]: list(embedding) for key, embedding in rows}
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding store lookup failed: {e}")
+            return {}
+
+    async def get(self, model: str, text: str) -> Optional[List[float]]:
+        return (await self.get_many(model, [text])).get(text)
+
+    async def put_many(self, model: str, embeddings: Dict[str, List[float]]):
+        """Store embeddings keyed by the text they were generated from"""
+        rows = [
+            (content_hash(model, text), model, len(embedding), list(embedding))
+            for text, embedding in embeddings.items()
+            if text and embedding
+        ]
+        if not rows:
+            return
+        try:
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                await cursor.executemany(_PUT_SQL.format(values="(%s, %s, %s, %s)"), rows)
+                await conn.commit()
+                await cursor.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding store write failed: {e}")
+
+    async def put(self, model: str, text: str, embedding: List[float]):
+        await self.put_many(model, {text: embedding})
+
+    async def prune(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently used embeddings beyond the entry/byte budgets"""
+        if not max_entries and not max_bytes:
+            return 0
+        try:
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                await cursor.execute(_PRUNE_SQL, (max_entries or _UNLIMITED, max_bytes or _UNLIMITED))
+                deleted = cursor.rowcount
+                await conn.commit()
+                await cursor.close()
+            return deleted
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding store prune failed: {e}")
+            return 0
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Entry count and size accounting"""
+        try:
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                await cursor.execute(_STATS_SQL)
+                row = await cursor.fetchone()
+                await cursor.close()
+            return _stats_row_to_dict(row)
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding store stats failed: {e}")
+            return {}
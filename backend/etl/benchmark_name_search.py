@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Name Search Benchmark
+Compares the old leading-wildcard LIKE name lookup with the trigram-indexed
+similarity search: query plan (sequential scan vs index scan) and latency.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+
+import psycopg2
+from dotenv import load_dotenv
+
+# Load .env from project root (../../.env from this file's location)
+load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
+
+LIKE_SQL = """
+    SELECT consultant_id, name
+    FROM consultants
+    WHERE LOWER(name) LIKE LOWER(%s)
+    ORDER BY name
+    LIMIT %s
+"""
+
+TRIGRAM_SQL = """
+    SELECT consultant_id, name,
+        GREATEST(similarity(name, %s), similarity(email, %s)) AS name_similarity
+    FROM consultants
+    WHERE name ILIKE %s OR email ILIKE %s OR name %% %s
+    ORDER BY name ILIKE %s DESC, name_similarity DESC, name
+    LIMIT %s
+"""
+
+
+def like_params(name, limit):
+    return (f"%{name}%", limit)
+
+
+def trigram_params(name, limit):
+    pattern = f"%{name}%"
+    return (name, name, pattern, pattern, name, pattern, limit)
+
+
+def plan_node_types(plan):
+    """Flatten an EXPLAIN (FORMAT JSON) plan into (node type, relation, index) tuples"""
+    nodes = [(plan.get("Node Type"), plan.get("Relation Name"), plan.get("Index Name"))]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_node_types(child))
+    return nodes
+
+
+def explain(cursor, sql, params):
+    cursor.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params)
+    result = cursor.fetchone()[0]
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]
+
+
+def time_query(cursor, sql, params, runs):
+    timings = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        cursor.execute(sql, params)
+        cursor.fetchall()
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return timings
+
+
+def report(label, cursor, sql, params, runs):
+    plan = explain(cursor, sql, params)
+    nodes = plan_node_types(plan["Plan"])
+    seq_scans = [relation for node_type, relation, _ in nodes if node_type == "Seq Scan"]
+    indexes = sorted({index for _, _, index in nodes if index})
+    timings = time_query(cursor, sql, params, runs)
+
+    print(f"\n📊 {label}")
+    print(f"   Plan nodes:       {' -> '.join(node_type for node_type, _, _ in nodes)}")
+    print(f"   Indexes used:     {', '.join(indexes) if indexes else 'none'}")
+    print(f"   Sequential scan:  {'❌ yes (' + ', '.join(seq_scans) + ')' if seq_scans else '✅ no'}")
+    print(f"   Execution time:   {plan['Execution Time']:.2f}ms (EXPLAIN ANALYZE)")
+    print(f"   Latency p50/max:  {statistics.median(timings):.2f}ms / {max(timings):.2f}ms over {runs} runs")
+    return not seq_scans
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark LIKE vs trigram name search")
+    parser.add_argument("names", nargs="*", default=["rich", "alex rihc", "smith"],
+                        help="name queries to benchmark (include a typo to see fuzzy matches)")
+    parser.add_argument("--limit", type=int, default=5, help="result limit per query")
+    parser.add_argument("--runs", type=int, default=50, help="timed runs per query")
+    parser.add_argument("--threshold", type=float,
+                        default=float(os.getenv("NAME_SIMILARITY_THRESHOLD", "0.3")),
+                        help="pg_trgm similarity threshold")
+    args = parser.parse_args()
+
+    print("🚀 Name Search Benchmark")
+    print("=" * 60)
+
+    if not os.getenv("POSTGRES_URL"):
+        print("❌ POSTGRES_URL not found in environment variables")
+        return
+
+    conn = psycopg2.connect(os.getenv("POSTGRES_URL"))
+    cursor = conn.cursor()
+    cursor.execute(f"SET pg_trgm.similarity_threshold = {float(args.threshold)}")
+    cursor.execute("SELECT COUNT(*) FROM consultants")
+    print(f"📈 Consultants: {cursor.fetchone()[0]}, similarity threshold: {args.threshold}")
+
+    for name in args.names:
+        print(f"\n🔍 Query: '{name}'")
+        print("-" * 60)
+        report("LIKE '%name%' (before)", cursor, LIKE_SQL, like_params(name, args.limit), args.runs)
+        index_only = report("Trigram similarity (after)", cursor, TRIGRAM_SQL, trigram_params(name, args.limit), args.runs)
+
+        cursor.execute(TRIGRAM_SQL, trigram_params(name, args.limit))
+        matches = [f"{row[1]} ({row[2]:.2f})" for row in cursor.fetchall()]
+        print(f"   Matches:          {', '.join(matches) if matches else 'none'}")
+
+        if not index_only:
+            print("   ⚠️ Planner chose a sequential scan - on very small tables this is expected; "
+                  "run ANALYZE consultants and check idx_consultants_name_trgm exists")
+
+    cursor.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
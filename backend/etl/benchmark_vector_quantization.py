@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Vector Quantization Benchmark
+Compares full-precision retrieval with compact first passes re-scored
+exactly against the float32 vectors:
+- in-app arrays (float32, float16, int8 scalar, binary) on the loaded or
+  synthetic embedding matrix: array memory, latency, recall@k
+- pgvector (none, halfvec, binary) when the database is available: index
+  size, query latency, recall@k against exact NumPy ground truth
+Queries are stored embeddings with Gaussian noise, so no embedding API is
+needed.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import psycopg2
+from dotenv import load_dotenv
+
+# Shared backend modules (vector_quantization) live one directory up
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from vector_quantization import QUANTIZATION_MODES, candidates_params, candidates_sql, first_pass_limit
+
+# Load .env from project root (../../.env from this file's location)
+load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
+
+LOAD_SQL = """
+    SELECT consultant_id, embedding::real[]
+    FROM consultants
+    WHERE embedding IS NOT NULL
+    ORDER BY consultant_id
+"""
+
+# Index serving each pgvector mode's first pass
+PGVECTOR_INDEXES = {
+    "none": ("idx_consultants_embedding_hnsw", "idx_consultants_embedding"),
+    "halfvec": ("idx_consultants_embedding_halfvec",),
+    "binary": ("idx_consultants_embedding_binary",),
+}
+
+# pgvector's hnsw.ef_search ceiling; first passes are capped to it like the API's
+MAX_EF_SEARCH = 1000
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+BLOCK_ROWS = 8192
+
+
+def normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+class InAppMode:
+    """Compact copy of the matrix and its approximate scorer"""
+
+    def __init__(self, name, matrix):
+        self.name = name
+        self.scales = None
+        if name == "float32":
+            self.data = matrix
+        elif name == "float16":
+            self.data = matrix.astype(np.float16)
+        elif name == "int8":
+            # Symmetric per-row scalar quantization
+            self.scales = np.abs(matrix).max(axis=1) / 127.0
+            self.scales[self.scales == 0] = 1.0
+            self.data = np.round(matrix / self.scales[:, None]).astype(np.int8)
+        elif name == "binary":
+            self.data = np.packbits(matrix > 0, axis=1)
+        else:
+            raise ValueError(f"Unknown mode: {name}")
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+    def scores(self, query):
+        if self.name == "float32":
+            return self.data @ query
+        if self.name == "binary":
+            query_bits = np.packbits(query > 0)
+            return -_POPCOUNT[np.bitwise_xor(self.data, query_bits)].sum(axis=1, dtype=np.int32)
+        # Upcast a block at a time; NumPy has no fast float16/int8 GEMV
+        scores = np.empty(self.data.shape[0], dtype=np.float32)
+        for start in range(0, self.data.shape[0], BLOCK_ROWS):
+            block = self.data[start:start + BLOCK_ROWS].astype(np.float32)
+            scores[start:start + BLOCK_ROWS] = block @ query
+        if self.scales is not None:
+            scores *= self.scales
+        return scores
+
+
+def top_k(scores, k):
+    k = min(k, scores.shape[0])
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+def search(mode, matrix, query, k, rerank_factor):
+    """Compact first pass, then exact float32 re-score of the candidates"""
+    candidates = top_k(mode.scores(query), k if mode.name == "float32" else k * rerank_factor)
+    if mode.name == "float32":
+        return candidates
+    exact = matrix[candidates] @ query
+    return candidates[top_k(exact, k)]
+
+
+def recall(found, expected):
+    return len(set(found) & set(expected)) / len(expected)
+
+
+def make_queries(matrix, count, noise, seed):
+    rng = np.random.default_rng(seed)
+    rows = matrix[rng.integers(0, matrix.shape[0], count)]
+    return normalize(rows + rng.normal(scale=noise / np.sqrt(matrix.shape[1]), size=rows.shape))
+
+
+def report(label, memory_label, memory_bytes, timings, recalls, k):
+    print(f"   {label:<10} {memory_label} {memory_bytes / 1024 / 1024:9.2f} MiB   "
+          f"p50 {statistics.median(timings):8.3f}ms   recall@{k} {statistics.mean(recalls):.3f}")
+
+
+def benchmark_in_app(matrix, queries, truth, k, rerank_factor):
+    print(f"\n📊 In-app arrays ({matrix.shape[0]} x {matrix.shape[1]}, re-score top {k * rerank_factor} in float32)")
+    for name in ("float32", "float16", "int8", "binary"):
+        mode = InAppMode(name, matrix)
+        timings, recalls = [], []
+        for query, expected in zip(queries, truth):
+            start_time = time.perf_counter()
+            found = search(mode, matrix, query, k, rerank_factor)
+            timings.append((time.perf_counter() - start_time) * 1000)
+            recalls.append(recall(found, expected))
+        report(name, "array", mode.nbytes, timings, recalls, k)
+
+
+def index_size(cursor, mode):
+    for index_name in PGVECTOR_INDEXES[mode]:
+        cursor.execute("SELECT to_regclass(%s)", (index_name,))
+        if cursor.fetchone()[0]:
+            cursor.execute("SELECT pg_relation_size(%s::regclass)", (index_name,))
+            return index_name, cursor.fetchone()[0]
+    return None, 0
+
+
+def benchmark_pgvector(cursor, ids, queries, truth, k, rerank_factor, dimensions, ef_search):
+    print(f"\n📊 pgvector (first pass LIMIT {k * rerank_factor} for quantized modes, exact re-score in SQL)")
+    for mode in QUANTIZATION_MODES:
+        index_name, size = index_size(cursor, mode)
+        if index_name is None:
+            print(f"   {mode:<10} ⚠️ no index - run: python check_schema.py --build-quantized-index {mode}"
+                  if mode != "none" else f"   {mode:<10} ⚠️ no vector index")
+            continue
+
+        sql = candidates_sql(mode, dimensions)
+        first_pass = first_pass_limit(mode, k, rerank_factor, MAX_EF_SEARCH)
+        cursor.execute(f"SET hnsw.ef_search = {int(min(max(ef_search, first_pass), MAX_EF_SEARCH))}")
+        timings, recalls = [], []
+        for query, expected in zip(queries, truth):
+            embedding_str = '[' + ','.join(map(str, query.tolist())) + ']'
+            start_time = time.perf_counter()
+            cursor.execute(sql, candidates_params(mode, embedding_str, k, rerank_factor, MAX_EF_SEARCH))
+            rows = cursor.fetchall()
+            timings.append((time.perf_counter() - start_time) * 1000)
+            recalls.append(recall([row[0] for row in rows], [ids[i] for i in expected]))
+        report(mode, "index", size, timings, recalls, k)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark quantized vector retrieval with exact re-scoring")
+    parser.add_argument("--queries", type=int, default=50, help="number of benchmark queries")
+    parser.add_argument("--k", type=int, default=10, help="results per query (recall@k)")
+    parser.add_argument("--rerank-factor", type=int, default=int(os.getenv("VECTOR_RERANK_FACTOR", "4")),
+                        help="first-pass candidates per result")
+    parser.add_argument("--noise", type=float, default=0.5, help="query perturbation (relative norm)")
+    parser.add_argument("--ef-search", type=int, default=40, help="minimum hnsw.ef_search")
+    parser.add_argument("--synthetic", type=int, metavar="ROWS",
+                        help="skip the database and benchmark clustered random unit vectors")
+    parser.add_argument("--dimensions", type=int, default=int(os.getenv("EMBEDDING_DIMENSIONS", "1536")),
+                        help="vector size for --synthetic and the pgvector casts")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("🚀 Vector Quantization Benchmark")
+    print("=" * 60)
+
+    conn = None
+    if args.synthetic:
+        # Clustered like real profiles (practice areas), so near neighbours are meaningful
+        rng = np.random.default_rng(args.seed)
+        centers = rng.normal(size=(max(args.synthetic // 100, 1), args.dimensions))
+        rows = centers[rng.integers(0, centers.shape[0], args.synthetic)]
+        matrix = normalize(rows + rng.normal(scale=0.8, size=rows.shape))
+        ids = [str(i) for i in range(args.synthetic)]
+    else:
+        if not os.getenv("POSTGRES_URL"):
+            print("❌ POSTGRES_URL not found in environment variables (or use --synthetic ROWS)")
+            return
+        conn = psycopg2.connect(os.getenv("POSTGRES_URL"))
+        cursor = conn.cursor()
+        cursor.execute(LOAD_SQL)
+        records = cursor.fetchall()
+        if not records:
+            print("❌ No embeddings found in consultants")
+            return
+        ids = [record[0] for record in records]
+        matrix = normalize(np.asarray([record[1] for record in records], dtype=np.float32))
+
+    queries = make_queries(matrix, args.queries, args.noise, args.seed)
+    truth = [top_k(matrix @ query, args.k) for query in queries]
+    print(f"📈 Vectors: {matrix.shape[0]}, dimensions: {matrix.shape[1]}, queries: {len(queries)}")
+
+    benchmark_in_app(matrix, queries, truth, args.k, args.rerank_factor)
+
+    if conn is not None:
+        benchmark_pgvector(cursor, ids, queries, truth, args.k, args.rerank_factor, matrix.shape[1], args.ef_search)
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,127 @@ Database Schema Creator and Checker
 This script will create the database schema and check all fields
 """
 
+import argparse
 import psycopg2
 import os
+import sys
 from dotenv import load_dotenv
 
+# Shared backend modules (vector_quantization) live one directory up
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from vector_quantization import INDEX_EXPRESSIONS, QUANTIZATION_MODES
+
 # Load .env from project root (../../.env from this file's location)
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
 
+# Vector index configuration
+VECTOR_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "hnsw")
+HNSW_M = int(os.getenv("HNSW_M", "16"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "64"))
+IVFFLAT_INDEX_NAME = "idx_consultants_embedding"
+HNSW_INDEX_NAME = "idx_consultants_embedding_hnsw"
+
+# Must match the embedding provider's output size (1536 for OpenAI ada-002)
+EMBEDDING_DIMENSIONS = int(os.getenv("EMBEDDING_DIMENSIONS", "1536"))
+
+# Compact first-pass index used by the API when VECTOR_QUANTIZATION is set
+VECTOR_QUANTIZATION = os.getenv("VECTOR_QUANTIZATION", "none")
+
+def quantized_index_name(mode):
+    return f"idx_consultants_embedding_{mode}"
+
+def index_exists(cursor, index_name):
+    """Check whether an index exists in the public schema"""
+    cursor.execute("SELECT 1 FROM pg_indexes WHERE schemaname = 'public' AND indexname = %s", (index_name,))
+    return cursor.fetchone() is not None
+
+def create_hnsw_index(cursor, m=16, ef_construction=64, concurrently=False):
+    """Build the HNSW cosine index on consultants.embedding"""
+    print(f"   Building HNSW index (m={m}, ef_construction={ef_construction})...")
+    cursor.execute(f"""
+        CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {HNSW_INDEX_NAME}
+        ON consultants USING hnsw (embedding vector_cosine_ops)
+        WITH (m = {int(m)}, ef_construction = {int(ef_construction)});
+    """)
+
+def create_quantized_index(cursor, mode, m=16, ef_construction=64, concurrently=False):
+    """Build the HNSW expression index over halfvec or binary-quantized embeddings (pgvector >= 0.7)"""
+    print(f"   Building {mode} HNSW index (m={m}, ef_construction={ef_construction})...")
+    expression = INDEX_EXPRESSIONS[mode].format(dimensions=EMBEDDING_DIMENSIONS)
+    cursor.execute(f"""
+        CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {quantized_index_name(mode)}
+        ON consultants USING hnsw ({expression})
+        WITH (m = {int(m)}, ef_construction = {int(ef_construction)});
+    """)
+
+def build_quantized_index(mode, m=16, ef_construction=64):
+    """Online build of a quantized index; reads and writes continue meanwhile"""
+    try:
+        conn = psycopg2.connect(os.getenv("POSTGRES_URL"))
+        conn.autocommit = True  # CONCURRENTLY cannot run inside a transaction
+        cursor = conn.cursor()
+        
+        print(f"🔧 Building {mode} first-pass vector index...")
+        create_quantized_index(cursor, mode, m, ef_construction, concurrently=True)
+        
+        cursor.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = %s::regclass", (quantized_index_name(mode),))
+        if not cursor.fetchone()[0]:
+            print(f"❌ {mode} index build did not complete - dropping invalid index")
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {quantized_index_name(mode)};")
+            cursor.close()
+            conn.close()
+            return False
+        
+        cursor.execute("SELECT pg_size_pretty(pg_relation_size(%s::regclass))", (quantized_index_name(mode),))
+        print(f"✅ {quantized_index_name(mode)} built ({cursor.fetchone()[0]}) - set VECTOR_QUANTIZATION={mode}")
+        
+        cursor.close()
+        conn.close()
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error building {mode} vector index: {e}")
+        return False
+
+def migrate_to_hnsw(m=16, ef_construction=64):
+    """Online migration off ivfflat: build HNSW concurrently, then drop the old index"""
+    try:
+        conn = psycopg2.connect(os.getenv("POSTGRES_URL"))
+        conn.autocommit = True  # CONCURRENTLY cannot run inside a transaction
+        cursor = conn.cursor()
+        
+        print("🔧 Migrating vector index from ivfflat to HNSW...")
+        
+        print("1. Building HNSW index concurrently (reads and writes continue)...")
+        create_hnsw_index(cursor, m, ef_construction, concurrently=True)
+        
+        # A failed concurrent build leaves an INVALID index behind
+        cursor.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = %s::regclass", (HNSW_INDEX_NAME,))
+        if not cursor.fetchone()[0]:
+            print("❌ HNSW index build did not complete - dropping invalid index, ivfflat kept")
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {HNSW_INDEX_NAME};")
+            cursor.close()
+            conn.close()
+            return False
+        
+        print("2. Dropping ivfflat index concurrently...")
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {IVFFLAT_INDEX_NAME};")
+        
+        print("3. Refreshing planner statistics...")
+        cursor.execute("ANALYZE consultants;")
+        
+        print("✅ Vector index migrated to HNSW")
+        
+        cursor.close()
+        conn.close()
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error migrating vector index: {e}")
+        return False
+
 def create_database_schema():
     """Create PostgreSQL database schema for consultant data"""
     try:
@@ -21,13 +135,14 @@ def create_database_schema():
         
         print("🔧 Creating PostgreSQL schema for consultant data...")
         
-        # Enable pgvector extension
-        print("1. Enabling pgvector extension...")
+        # Enable pgvector and trigram extensions
+        print("1. Enabling pgvector and pg_trgm extensions...")
         cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
         
         # Create consultants table
         print("2. Creating consultants table...")
-        cursor.execute("""
+        cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS consultants (
                 id SERIAL PRIMARY KEY,
                 consultant_id VARCHAR(50) UNIQUE NOT NULL,
@@ -123,7 +238,9 @@ def create_database_schema():
                 form_text TEXT,
                 
                 -- Single comprehensive embedding for all data
-                embedding vector(1536), -- OpenAI ada-002 embedding dimension
+                embedding vector({EMBEDDING_DIMENSIONS}), -- embedding provider's dimension
+                embedding_model VARCHAR(100), -- provider model that produced the embedding
+                embedding_dimensions INTEGER,
                 
                 -- Full text search
                 search_text TEXT,
@@ -133,6 +250,12 @@ def create_database_schema():
             );
         """)
         
+        # Tables created before providers were pluggable
+        cursor.execute("""
+            ALTER TABLE consultants ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(100);
+            ALTER TABLE consultants ADD COLUMN IF NOT EXISTS embedding_dimensions INTEGER;
+        """)
+        
         # Create attachments table
         print("3. Creating attachments table...")
         cursor.execute("""
@@ -163,11 +286,24 @@ def create_database_schema():
             CREATE INDEX IF NOT EXISTS idx_consultants_modified_time ON consultants(modified_time);
             CREATE INDEX IF NOT EXISTS idx_consultants_search_text ON consultants USING gin(to_tsvector('english', search_text));
             CREATE INDEX IF NOT EXISTS idx_consultants_zoho_data ON consultants USING gin(zoho_data);
-            
-            -- Vector similarity search index
-            CREATE INDEX IF NOT EXISTS idx_consultants_embedding ON consultants USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+            CREATE INDEX IF NOT EXISTS idx_consultants_name_trgm ON consultants USING gin(name gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_consultants_email_trgm ON consultants USING gin(email gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_consultants_name_keyset ON consultants((COALESCE(name, '')), consultant_id);
         """)
         
+        # Vector similarity search index (HNSW by default; ivfflat kept for older pgvector)
+        if VECTOR_INDEX_TYPE == "hnsw":
+            if index_exists(cursor, IVFFLAT_INDEX_NAME):
+                print("   ⚠️ ivfflat index found - run: python check_schema.py --migrate-hnsw")
+            else:
+                create_hnsw_index(cursor, HNSW_M, HNSW_EF_CONSTRUCTION)
+        else:
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS {IVFFLAT_INDEX_NAME} ON consultants USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+            """)
+        if VECTOR_QUANTIZATION != "none":
+            create_quantized_index(cursor, VECTOR_QUANTIZATION, HNSW_M, HNSW_EF_CONSTRUCTION)
+        
         # Create sync tracking table
         print("5. Creating sync tracking table...")
         cursor.execute("""
@@ -186,6 +322,43 @@ def create_database_schema():
             );
         """)
         
+        # Create content-addressed embedding store shared by ETL and API
+        print("6. Creating embedding store table...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_store (
+                content_hash CHAR(64) PRIMARY KEY, -- sha256(model, text)
+                model VARCHAR(100) NOT NULL,
+                dimensions INTEGER NOT NULL,
+                embedding REAL[] NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE INDEX IF NOT EXISTS idx_embedding_store_last_used ON embedding_store(last_used_at);
+        """)
+        
+        # Data version bumped by any write to consultants; API caches key on it
+        print("7. Creating data version trigger...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS data_version (
+                id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id), -- single row
+                version BIGINT NOT NULL DEFAULT 1,
+                changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            INSERT INTO data_version (id) VALUES (TRUE) ON CONFLICT (id) DO NOTHING;
+            
+            CREATE OR REPLACE FUNCTION bump_data_version() RETURNS trigger AS $$
+            BEGIN
+                UPDATE data_version SET version = version + 1, changed_at = CURRENT_TIMESTAMP;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            
+            DROP TRIGGER IF EXISTS trg_consultants_data_version ON consultants;
+            CREATE TRIGGER trg_consultants_data_version
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON consultants
+                FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version();
+        """)
+        
         print("✅ Database schema created successfully!")
         
         # Show table info
@@ -196,7 +369,7 @@ def create_database_schema():
                 tableowner
             FROM pg_tables 
             WHERE schemaname = 'public' 
-            AND tablename IN ('consultants', 'consultant_attachments', 'sync_log')
+            AND tablename IN ('consultants', 'consultant_attachments', 'sync_log', 'embedding_store', 'data_version')
             ORDER BY tablename;
         """)
         
@@ -287,6 +460,18 @@ def check_database_schema():
         else:
             print("\n🧠 No embedding columns found")
         
+        # Which providers produced the stored vectors
+        if any(col[0] == 'embedding_model' for col in columns):
+            cursor.execute("""
+                SELECT embedding_model, embedding_dimensions, COUNT(*)
+                FROM consultants
+                WHERE embedding IS NOT NULL
+                GROUP BY embedding_model, embedding_dimensions
+                ORDER BY COUNT(*) DESC;
+            """)
+            for model, dimensions, model_count in cursor.fetchall():
+                print(f"   - {model or 'unknown model'} ({dimensions or '?'} dims): {model_count} embeddings")
+        
         # Check current record count
         cursor.execute("SELECT COUNT(*) FROM consultants;")
         count = cursor.fetchone()[0]
@@ -344,6 +529,16 @@ def check_json_structure():
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Create and check the consultant database schema")
+    parser.add_argument("--migrate-hnsw", action="store_true",
+                        help="build the HNSW index concurrently and drop the ivfflat index")
+    parser.add_argument("--hnsw-m", type=int, default=HNSW_M, help="HNSW max connections per layer")
+    parser.add_argument("--hnsw-ef-construction", type=int, default=HNSW_EF_CONSTRUCTION,
+                        help="HNSW candidate list size during build")
+    parser.add_argument("--build-quantized-index", choices=[mode for mode in QUANTIZATION_MODES if mode != "none"],
+                        help="concurrently build the halfvec or binary first-pass index")
+    args = parser.parse_args()
+    
     print("🚀 Database Schema Creator & Checker")
     print("=" * 60)
     
@@ -352,6 +547,14 @@ def main():
         print("❌ POSTGRES_URL not found in environment variables")
         return
     
+    if args.migrate_hnsw:
+        migrate_to_hnsw(args.hnsw_m, args.hnsw_ef_construction)
+        return
+    
+    if args.build_quantized_index:
+        build_quantized_index(args.build_quantized_index, args.hnsw_m, args.hnsw_ef_construction)
+        return
+    
     # First, create/update database schema
     print("\n🔧 Step 1: Creating/Updating Database Schema")
     print("-" * 50)
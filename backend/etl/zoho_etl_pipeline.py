@@ -12,6 +12,7 @@ import asyncio
 import json
 import logging
 import os
+import sys
 import psycopg2
 import requests
 import schedule
@@ -19,7 +20,12 @@ import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
-import openai
+
+# Shared backend modules (db_pool, embedding_store, embedding_provider) live one directory up
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from db_pool import ConnectionPool
+from embedding_store import EmbeddingStore
+from embedding_provider import MAX_EMBEDDING_CHARS, create_embedding_provider, embed_with_retry
 
 # Load .env from project root
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
@@ -50,9 +56,15 @@ class ZohoETLPipeline:
         # PostgreSQL configuration
         self.postgres_url = os.getenv("POSTGRES_URL")
         
-        # OpenAI configuration
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.openai_client = openai.OpenAI(api_key=self.openai_api_key) if self.openai_api_key else None
+        # Embedding backend (EMBEDDING_PROVIDER: openai, local or hashing); must match the API's
+        try:
+            self.embedding_provider = create_embedding_provider()
+            self.embedding_model = self.embedding_provider.model
+        except (ValueError, ImportError) as e:
+            # Missing config or optional dependency (local provider): load data without embeddings
+            self.embedding_provider = None
+            self.embedding_model = None
+            logger.warning(f"⚠️ {e} - embeddings will be skipped")
         
         # Data directory
         self.data_dir = "data"
@@ -62,40 +74,21 @@ class ZohoETLPipeline:
         if not all([self.client_id, self.client_secret, self.refresh_token, self.postgres_url]):
             raise ValueError("Missing required environment variables in .env file")
         
-        if not self.openai_api_key:
-            logger.warning("⚠️ OPENAI_API_KEY not found - embeddings will be skipped")
-    
-    def get_embedding(self, text: str) -> Optional[List[float]]:
-        """Generate OpenAI embedding for text with retry logic"""
-        if not self.openai_client or not text:
-            return None
+        # Synchronous connection pool reused across every consultant write
+        self.pool = ConnectionPool.from_env(self.postgres_url)
         
-        try:
-            # Truncate text if too long (OpenAI limit is 8192 tokens, roughly 6000 chars)
-            if len(text) > 6000:
-                text = text[:6000]
-            
-            # Add retry logic for API errors
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = self.openai_client.embeddings.create(
-                        model="text-embedding-ada-002",
-                        input=text
-                    )
-                    return response.data[0].embedding
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        logger.warning(f"OpenAI API error (attempt {attempt + 1}), retrying in {wait_time}s: {e}")
-                        time.sleep(wait_time)
-                    else:
-                        logger.error(f"OpenAI API failed after {max_retries} attempts: {e}")
-                        return None
-            
-        except Exception as e:
-            logger.error(f"Error generating embedding: {e}")
-            return None
+        # Embeddings of unchanged text are reused across syncs
+        self.embedding_store = EmbeddingStore(self.pool)
+        self.embedding_store_max_entries = int(os.getenv("EMBEDDING_STORE_MAX_ENTRIES", "200000"))
+    
+    def get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Get embeddings for texts, only calling the provider for text not already in the embedding store"""
+        if not self.embedding_provider:
+            return [None] * len(texts)
+        texts = [text[:MAX_EMBEDDING_CHARS] if text else '' for text in texts]
+        return self.embedding_store.get_or_embed(
+            self.embedding_model, texts, lambda text: embed_with_retry(self.embedding_provider, text)
+        )
     
     def get_access_token(self) -> Optional[str]:
         """Get access token from refresh token"""
@@ -365,9 +358,6 @@ class ZohoETLPipeline:
     def migrate_consultant_to_db(self, consultant: Dict[str, Any]) -> bool:
         """Migrate a single consultant to PostgreSQL with embeddings"""
         try:
-            conn = psycopg2.connect(self.postgres_url)
-            cursor = conn.cursor()
-            
             # Create search text
             search_fields = [
                 consultant.get('name', ''),
@@ -393,83 +383,87 @@ class ZohoETLPipeline:
             
             search_text = ' '.join(filter(None, search_fields))
             
-            # Generate embedding
-            embedding = self.get_embedding(search_text)
-            
-            # Insert consultant with embedding
-            cursor.execute("""
-                INSERT INTO consultants (
-                    consultant_id, name, email, phone, contact_type, 
-                    consultant_status, search_text, embedding, zoho_data
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (consultant_id) DO UPDATE SET
-                    name = EXCLUDED.name,
-                    email = EXCLUDED.email,
-                    phone = EXCLUDED.phone,
-                    contact_type = EXCLUDED.contact_type,
-                    consultant_status = EXCLUDED.consultant_status,
-                    search_text = EXCLUDED.search_text,
-                    embedding = EXCLUDED.embedding,
-                    zoho_data = EXCLUDED.zoho_data,
-                    extracted_at = CURRENT_TIMESTAMP
-            """, (
-                consultant.get('consultant_id'),
-                consultant.get('name'),
-                consultant.get('email'),
-                consultant.get('phone'),
-                consultant.get('contact_type'),
-                consultant.get('consultant_status'),
-                search_text,
-                embedding,
-                json.dumps(consultant)
-            ))
-            
-            # Insert attachments with embeddings
-            for attachment in consultant.get('attachments', []):
-                attachment_embedding = self.get_embedding(attachment.get('extracted_text', ''))
-                
+            # Generate consultant and attachment embeddings with one embedding store lookup, before borrowing a pooled connection
+            attachments = consultant.get('attachments', [])
+            embedding, *attachment_embeddings = self.get_embeddings(
+                [search_text] + [attachment.get('extracted_text', '') for attachment in attachments]
+            )
+            
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+            
+                # Insert consultant with embedding
                 cursor.execute("""
-                    INSERT INTO consultant_attachments (
-                        consultant_id, attachment_id, file_name, file_size, file_type,
-                        created_by, created_time, modified_time, file_url, extracted_text,
-                        attachment_embedding
+                    INSERT INTO consultants (
+                        consultant_id, name, email, phone, contact_type, 
+                        consultant_status, search_text, embedding, embedding_model, embedding_dimensions, zoho_data
                     ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (consultant_id, attachment_id) DO UPDATE SET
-                        file_name = EXCLUDED.file_name,
-                        file_size = EXCLUDED.file_size,
-                        file_type = EXCLUDED.file_type,
-                        created_by = EXCLUDED.created_by,
-                        created_time = EXCLUDED.created_time,
-                        modified_time = EXCLUDED.modified_time,
-                        file_url = EXCLUDED.file_url,
-                        extracted_text = EXCLUDED.extracted_text,
-                        attachment_embedding = EXCLUDED.attachment_embedding,
-                        created_at = CURRENT_TIMESTAMP
+                    ON CONFLICT (consultant_id) DO UPDATE SET
+                        name = EXCLUDED.name,
+                        email = EXCLUDED.email,
+                        phone = EXCLUDED.phone,
+                        contact_type = EXCLUDED.contact_type,
+                        consultant_status = EXCLUDED.consultant_status,
+                        search_text = EXCLUDED.search_text,
+                        embedding = EXCLUDED.embedding,
+                        embedding_model = EXCLUDED.embedding_model,
+                        embedding_dimensions = EXCLUDED.embedding_dimensions,
+                        zoho_data = EXCLUDED.zoho_data,
+                        extracted_at = CURRENT_TIMESTAMP
                 """, (
                     consultant.get('consultant_id'),
-                    attachment.get('id'),
-                    attachment.get('file_name'),
-                    attachment.get('file_size'),
-                    attachment.get('file_type'),
-                    attachment.get('created_by'),
-                    attachment.get('created_time'),
-                    attachment.get('modified_time'),
-                    attachment.get('file_url'),
-                    attachment.get('extracted_text'),
-                    attachment_embedding
+                    consultant.get('name'),
+                    consultant.get('email'),
+                    consultant.get('phone'),
+                    consultant.get('contact_type'),
+                    consultant.get('consultant_status'),
+                    search_text,
+                    embedding,
+                    self.embedding_model if embedding else None,
+                    len(embedding) if embedding else None,
+                    json.dumps(consultant)
                 ))
             
-            conn.commit()
-            cursor.close()
-            conn.close()
+                # Insert attachments with embeddings
+                for attachment, attachment_embedding in zip(attachments, attachment_embeddings):
+                    cursor.execute("""
+                        INSERT INTO consultant_attachments (
+                            consultant_id, attachment_id, file_name, file_size, file_type,
+                            created_by, created_time, modified_time, file_url, extracted_text,
+                            attachment_embedding
+                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        ON CONFLICT (consultant_id, attachment_id) DO UPDATE SET
+                            file_name = EXCLUDED.file_name,
+                            file_size = EXCLUDED.file_size,
+                            file_type = EXCLUDED.file_type,
+                            created_by = EXCLUDED.created_by,
+                            created_time = EXCLUDED.created_time,
+                            modified_time = EXCLUDED.modified_time,
+                            file_url = EXCLUDED.file_url,
+                            extracted_text = EXCLUDED.extracted_text,
+                            attachment_embedding = EXCLUDED.attachment_embedding,
+                            created_at = CURRENT_TIMESTAMP
+                    """, (
+                        consultant.get('consultant_id'),
+                        attachment.get('id'),
+                        attachment.get('file_name'),
+                        attachment.get('file_size'),
+                        attachment.get('file_type'),
+                        attachment.get('created_by'),
+                        attachment.get('created_time'),
+                        attachment.get('modified_time'),
+                        attachment.get('file_url'),
+                        attachment.get('extracted_text'),
+                        attachment_embedding
+                    ))
+            
+                conn.commit()
+                cursor.close()
             
             return True
             
         except Exception as e:
             logger.error(f"Error migrating consultant {consultant.get('consultant_id')}: {e}")
-            if 'conn' in locals():
-                conn.rollback()
-                conn.close()
             return False
     
     async def run_full_sync(self) -> Dict[str, Any]:
@@ -520,6 +514,9 @@ class ZohoETLPipeline:
                 if i % 50 == 0:
                     logger.info(f"Migrated {i}/{len(consultants)} consultants to database")
             
+            # Step 6: Keep the embedding store within budget
+            self.embedding_store.prune(max_entries=self.embedding_store_max_entries)
+            
             result = {
                 "success": True,
                 "message": f"Full sync completed successfully",
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Streaming Export Serializers
+Turn batches of consultant rows into NDJSON or CSV text one batch at a
+time, optionally gzip-compressed on the fly, so an export never holds
+more than one fetch in memory.
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import AsyncIterator, Iterable, Optional, Sequence, Tuple
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value):
+    # Decimal rates and timestamps
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def ndjson_chunk(columns: Sequence[str], rows: Iterable[Tuple]) -> str:
+    """One JSON object per line"""
+    return "".join(
+        json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def csv_header(columns: Sequence[str]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(columns)
+    return buffer.getvalue()
+
+
+def csv_chunk(rows: Iterable[Tuple]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+    return buffer.getvalue()
+
+
+async def serialize_rows(fmt: str, columns: Sequence[str], batches: AsyncIterator[Sequence[Tuple]]) -> AsyncIterator[bytes]:
+    """Encode row batches as they arrive"""
+    if fmt == "csv":
+        yield csv_header(columns).encode("utf-8")
+    async for rows in batches:
+        text = csv_chunk(rows) if fmt == "csv" else ndjson_chunk(columns, rows)
+        if text:
+            yield text.encode("utf-8")
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows gzip (RFC 9110 q-values)
+
+    An explicit gzip (or x-gzip) entry decides; otherwise a "*" entry does.
+    q=0 means "not acceptable".
+    """
+    qualities = {}
+    for entry in (accept_encoding or "").split(","):
+        coding, *params = [part.strip() for part in entry.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Incremental gzip; each input chunk is sync-flushed so clients see data while the export runs"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
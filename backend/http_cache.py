@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+HTTP Conditional GET Helpers
+ETag matching for If-None-Match and the Cache-Control/ETag headers sent
+with version-tagged responses.
+"""
+
+from typing import Dict, Optional
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison per RFC 9110: W/ prefixes are ignored, '*' matches anything"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag.removeprefix("W/") for tag in candidates)
+
+
+def cache_headers(etag: str, max_age: int = 0) -> Dict[str, str]:
+    """Shared caches may store the response but must revalidate it once ``max_age`` passes"""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={int(max_age)}, must-revalidate",
+    }
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Hybrid Search Helpers
+Reciprocal-rank fusion of lexical (full-text) and vector rankings, plus the
+heuristic that routes obvious keyword lookups to the lexical-only fast path.
+"""
+
+import re
+from typing import Dict, List, Sequence, Tuple
+
+# Certification acronyms and codes: "CPA", "PMP", "ISO", "SOC2", "C++". Three
+# characters minimum: two-letter terms ("AI", "HR", "PR", "IT") name domains,
+# which are concept queries the vector side should see.
+_ACRONYM = re.compile(r"^[A-Z][A-Z0-9&+./-]{2,9}$")
+
+
+def is_keyword_query(query: str) -> bool:
+    """True when the query is clearly an exact-term lookup that embeddings handle badly
+
+    A quoted phrase, or a single token that is an email address or an
+    acronym/code. Anything longer is a concept query, even with a number in it.
+    """
+    stripped = query.strip()
+    if len(stripped) >= 2 and stripped[0] == stripped[-1] == '"':
+        return True
+
+    tokens = stripped.split()
+    if len(tokens) != 1:
+        return False
+    return '@' in tokens[0] or bool(_ACRONYM.match(tokens[0]))
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """Fuse ranked id lists: score(id) = sum over lists of 1 / (k + rank), rank starting at 1"""
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, 1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
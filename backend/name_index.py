@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Consultant Name Prefix Index
+In-process sorted-array index over normalized first, last and full names
+for type-ahead lookups, refreshed incrementally from rows whose
+extracted_at moved since the last load.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Columns returned by autocomplete, in result order
+SUGGESTION_COLUMNS = ('consultant_id', 'name', 'title', 'practice_area', 'consultant_status')
+
+_LOAD_SQL = f"""
+    SELECT {', '.join(SUGGESTION_COLUMNS)}, first_name, last_name, extracted_at
+    FROM consultants
+    WHERE name IS NOT NULL
+"""
+
+# >= so rows stamped in the same instant as the high-water mark are not missed
+_CHANGED_SQL = _LOAD_SQL + " AND extracted_at >= %s"
+
+_COUNT_SQL = "SELECT COUNT(*) FROM consultants WHERE name IS NOT NULL"
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """Case-fold, strip accents and collapse whitespace: 'José  Núñez' -> 'jose nunez'"""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+def _name_keys(name: str, first_name: Optional[str], last_name: Optional[str]) -> List[str]:
+    """Every key a prefix can match: the full name and each name part"""
+    full = normalize_name(name)
+    keys = {full, normalize_name(first_name), normalize_name(last_name)}
+    keys.update(full.split())
+    keys.discard("")
+    return list(keys)
+
+
+class NameIndex:
+    """Prefix lookups over consultant names via bisect on a sorted key array"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._record_keys: Dict[str, List[str]] = {}
+        self._full_names: Dict[str, str] = {}
+        # Parallel sorted arrays, swapped in as a pair so readers never see a half-built index
+        self._arrays: Tuple[List[str], List[str]] = ([], [])
+        self._high_water: Optional[Any] = None
+        self._refresh_lock = asyncio.Lock()
+        self.loaded_at: Optional[float] = None
+        self.full_rebuilds = 0
+        self.incremental_updates = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def _apply(self, rows: List[Tuple], replace: bool) -> int:
+        """Merge rows into the index and re-sort the key arrays; returns the number of changed rows"""
+        if replace:
+            self._records = {}
+            self._record_keys = {}
+            self._full_names = {}
+            self._high_water = None
+
+        changed = 0
+        n_columns = len(SUGGESTION_COLUMNS)
+        for row in rows:
+            record = dict(zip(SUGGESTION_COLUMNS, row[:n_columns]))
+            first_name, last_name, extracted_at = row[n_columns:]
+            if extracted_at is not None and (self._high_water is None or extracted_at > self._high_water):
+                self._high_water = extracted_at
+
+            consultant_id = record['consultant_id']
+            keys = _name_keys(record['name'], first_name, last_name)
+            if self._records.get(consultant_id) == record and self._record_keys.get(consultant_id) == keys:
+                continue
+            self._records[consultant_id] = record
+            self._record_keys[consultant_id] = keys
+            self._full_names[consultant_id] = normalize_name(record['name'])
+            changed += 1
+
+        if changed or replace:
+            pairs = sorted(
+                (key, consultant_id)
+                for consultant_id, keys in self._record_keys.items()
+                for key in keys
+            )
+            self._arrays = ([key for key, _ in pairs], [consultant_id for _, consultant_id in pairs])
+        return changed
+
+    async def refresh(self, force: bool = False) -> int:
+        """Merge rows changed since the last load; full reload on first load or when rows were deleted"""
+        async with self._refresh_lock:
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                full = force or self._high_water is None
+                if full:
+                    await cursor.execute(_LOAD_SQL)
+                else:
+                    await cursor.execute(_CHANGED_SQL, (self._high_water,))
+                rows = await cursor.fetchall()
+
+                if not full:
+                    await cursor.execute(_COUNT_SQL)
+                    total = (await cursor.fetchone())[0]
+                    known = set(self._records) | {row[0] for row in rows}
+                    if total != len(known):
+                        # Deletions are invisible to the extracted_at delta
+                        full = True
+                        await cursor.execute(_LOAD_SQL)
+                        rows = await cursor.fetchall()
+                await cursor.close()
+
+            changed = self._apply(rows, replace=full)
+            if full:
+                self.loaded_at = time.time()
+                self.full_rebuilds += 1
+                logger.info(f"🔤 Name index loaded {len(self._records)} consultants")
+            elif changed:
+                self.loaded_at = time.time()
+                self.incremental_updates += 1
+            return changed
+
+    async def run_refresh_loop(self, interval: float):
+        """Poll for data changes and refresh in the background"""
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error refreshing name index: {e}")
+            await asyncio.sleep(interval)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Consultants with a name part starting with ``prefix``, full-name matches first"""
+        needle = normalize_name(prefix)
+        keys, ids = self._arrays
+        if not needle or limit <= 0:
+            return []
+
+        full_matches: List[str] = []
+        part_matches: List[str] = []
+        seen = set()
+        position = bisect.bisect_left(keys, needle)
+        while position < len(keys) and keys[position].startswith(needle):
+            consultant_id = ids[position]
+            if consultant_id not in seen:
+                seen.add(consultant_id)
+                if self._full_names[consultant_id].startswith(needle):
+                    full_matches.append(consultant_id)
+                    if len(full_matches) >= limit:
+                        break
+                else:
+                    part_matches.append(consultant_id)
+            position += 1
+
+        ranked = full_matches + part_matches
+        return [dict(self._records[consultant_id]) for consultant_id in ranked[:limit]]
+
+    def get_stats(self) -> Dict[str, Any]:
+        keys, _ = self._arrays
+        return {
+            'loaded': self.is_loaded,
+            'consultants': len(self._records),
+            'keys': len(keys),
+            'full_rebuilds': self.full_rebuilds,
+            'incremental_updates': self.incremental_updates,
+            'loaded_at': self.loaded_at,
+        }
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Keyset Pagination Cursors
+Opaque tokens carrying the (name, consultant_id) sort key of a page
+boundary and the direction to read from it.
+"""
+
+import base64
+import json
+from typing import Optional, Tuple
+
+NEXT = "next"
+PREV = "prev"
+
+
+def encode_cursor(direction: str, name: Optional[str], consultant_id: str) -> str:
+    """Opaque, URL-safe token for the row at a page boundary"""
+    payload = json.dumps([direction, name or "", consultant_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[str, str, str]:
+    """Return (direction, name, consultant_id); raises ValueError on a malformed token"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        direction, name, consultant_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+    if direction not in (NEXT, PREV) or not isinstance(name, str) or not isinstance(consultant_id, str):
+        raise ValueError("Invalid pagination cursor")
+    return direction, name, consultant_id
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Consultant Profile Cache
+Bounded in-process LRU of consultant profiles keyed by id and projected
+field set, valid for a single data version (see versioned_cache).
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from versioned_cache import VersionedLRUCache
+
+
+class ProfileCache(VersionedLRUCache):
+    """LRU of profile dicts for the current data version"""
+
+    def __init__(self, max_entries: int = 2000):
+        super().__init__(max_entries)
+
+    def get(self, consultant_id: str, fields: Tuple[str, ...], version: int) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached profile, or None on a miss or stale version"""
+        profile = self.lookup((consultant_id, fields), version)
+        return dict(profile) if profile is not None else None
+
+    def put(self, consultant_id: str, fields: Tuple[str, ...], version: int, profile: Dict[str, Any]):
+        self.store((consultant_id, fields), version, dict(profile))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Second-Stage Reranker
+Scores retrieved candidates in one vectorized NumPy pass:
+
+    score = base
+          + status_weight  * (consultant_status == 'Active')
+          + recency_weight * 0.5 ** (days since last_activity_time / half-life)
+          + rate_weight    * rate fit
+
+The base is the cosine similarity for semantic results. Hybrid and lexical
+rows found only by full-text search have no similarity, so those modes use
+the fused retrieval score (rrf_score) divided by the best candidate's: the
+fused order is kept, on the same 0-1 scale the boosts are tuned against.
+
+Rate fit is 1 when hourly_rate_low is within the budget, falling linearly to
+0 at twice the budget; without a budget it is 1 for any consultant with a
+rate on file. Missing values contribute 0, so incomplete profiles sink
+instead of ranking alongside complete ones.
+"""
+
+import datetime
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+WEIGHT_NAMES = ("status", "recency", "rate")
+
+_SECONDS_PER_DAY = 86400.0
+
+
+def _epoch(value: Any) -> float:
+    # Rows carry datetimes straight from psycopg; cached or JSON rows may carry ISO strings
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return np.nan
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(value, datetime.time()).timestamp()
+    return np.nan
+
+
+def _check_weights(weights: Dict[str, float]):
+    # NaN or inf in any weight would turn every score into NaN
+    invalid = [name for name, value in weights.items() if not math.isfinite(value)]
+    if invalid:
+        raise ValueError(f"Rerank weights must be finite numbers: {', '.join(sorted(invalid))}")
+
+
+def _floats(candidates: List[Dict[str, Any]], key: str) -> np.ndarray:
+    # None -> NaN; Decimal rates convert through float()
+    return np.array([np.nan if c.get(key) is None else float(c[key]) for c in candidates], dtype=np.float64)
+
+
+class Reranker:
+    """Weighted cosine + status/recency/rate boosts"""
+
+    def __init__(
+        self,
+        status_weight: float = 0.05,
+        recency_weight: float = 0.05,
+        rate_weight: float = 0.05,
+        recency_half_life_days: float = 180.0,
+        active_status: str = "Active",
+    ):
+        if recency_half_life_days <= 0:
+            raise ValueError(f"Invalid recency_half_life_days: {recency_half_life_days}")
+        _check_weights({'status': status_weight, 'recency': recency_weight, 'rate': rate_weight})
+
+        self.status_weight = status_weight
+        self.recency_weight = recency_weight
+        self.rate_weight = rate_weight
+        self.recency_half_life_days = recency_half_life_days
+        self.active_status = active_status
+
+        self.calls = 0
+        self.candidates_scored = 0
+        self.time_total = 0.0
+
+    def resolve_weights(self, overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """Configured weights with per-request overrides (keys: status, recency, rate)"""
+        weights = {'status': self.status_weight, 'recency': self.recency_weight, 'rate': self.rate_weight}
+        if overrides:
+            unknown = set(overrides) - set(WEIGHT_NAMES)
+            if unknown:
+                raise ValueError(f"Unknown rerank weights: {', '.join(sorted(unknown))} (allowed: {', '.join(WEIGHT_NAMES)})")
+            _check_weights(overrides)
+            weights.update(overrides)
+        return weights
+
+    def score(self, candidates: List[Dict[str, Any]], budget: Optional[float] = None,
+              weights: Optional[Dict[str, float]] = None, now: Optional[float] = None,
+              base_key: str = "similarity_score") -> np.ndarray:
+        """Final score per candidate, in input order"""
+        weights = self.resolve_weights(weights)
+        now = time.time() if now is None else now
+
+        base = np.nan_to_num(_floats(candidates, base_key))
+        if base_key != "similarity_score" and base.size and base.max() > 0:
+            base /= base.max()
+        active = np.fromiter(
+            (c.get("consultant_status") == self.active_status for c in candidates), dtype=bool, count=len(candidates)
+        )
+
+        age_days = (now - np.array([_epoch(c.get("last_activity_time")) for c in candidates])) / _SECONDS_PER_DAY
+        recency = np.nan_to_num(0.5 ** (np.maximum(age_days, 0.0) / self.recency_half_life_days))
+
+        low, high = _floats(candidates, "hourly_rate_low"), _floats(candidates, "hourly_rate_high")
+        low = np.where(np.isnan(low), high, low)
+        if budget:
+            rate_fit = np.nan_to_num(np.clip(1.0 - (low - budget) / budget, 0.0, 1.0))
+        else:
+            rate_fit = (~np.isnan(low)).astype(np.float64)
+
+        return (
+            base
+            + weights['status'] * active
+            + weights['recency'] * recency
+            + weights['rate'] * rate_fit
+        )
+
+    def rerank(self, candidates: List[Dict[str, Any]], limit: Optional[int] = None, budget: Optional[float] = None,
+               weights: Optional[Dict[str, float]] = None, base_key: str = "similarity_score") -> List[Dict[str, Any]]:
+        """Candidates in final-score order, each with ``rerank_score``; ties keep retrieval order
+
+        ``base_key`` names the retrieval score to boost: similarity_score for
+        semantic results, rrf_score for hybrid and lexical ones.
+        """
+        if not candidates:
+            return []
+        start_time = time.perf_counter()
+        scores = self.score(candidates, budget, weights, base_key=base_key)
+        order = np.argsort(-scores, kind="stable")[:limit]
+        results = []
+        for i in order:
+            consultant = candidates[i]
+            consultant["rerank_score"] = float(scores[i])
+            results.append(consultant)
+        self.calls += 1
+        self.candidates_scored += len(candidates)
+        self.time_total += time.perf_counter() - start_time
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'weights': self.resolve_weights(),
+            'recency_half_life_days': self.recency_half_life_days,
+            'calls': self.calls,
+            'candidates_scored': self.candidates_scored,
+            'time_avg': self.time_total / self.calls if self.calls else 0.0,
+        }
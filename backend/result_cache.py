@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Search Result Cache
+Bounded in-process LRU of complete ranked search results keyed by the
+exact request, valid for a single data version (see versioned_cache):
+results only change when the consultants table does.
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from versioned_cache import VersionedLRUCache
+
+SearchResult = Tuple[List[Dict[str, Any]], Dict[str, Any]]
+
+
+class ResultCache(VersionedLRUCache):
+    """LRU of (results, search_stats) pairs for the current data version"""
+
+    def __init__(self, max_entries: int = 1000):
+        super().__init__(max_entries)
+
+    def get(self, key: Hashable, version: int) -> Optional[SearchResult]:
+        """Return copies of the cached results and stats, or None on a miss or stale version"""
+        entry = self.lookup(key, version)
+        if entry is None:
+            return None
+        results, search_stats = entry
+        return [dict(result) for result in results], dict(search_stats)
+
+    def put(self, key: Hashable, version: int, results: List[Dict[str, Any]], search_stats: Dict[str, Any]):
+        """Store a search computed against ``version``; ignored if a newer version was seen meanwhile"""
+        self.store(key, version, ([dict(result) for result in results], dict(search_stats)))
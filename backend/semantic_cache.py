@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Semantic Query Cache
+Recent query embeddings kept as unit rows of a preallocated float32
+matrix. A new query whose embedding is within a cosine threshold of a
+cached one (with the same limit and filters) reuses that query's ranking,
+so paraphrases like "marketing strategy expert" and "expert in marketing
+strategy" cost one matrix-vector product instead of a database search.
+Entries are evicted least recently used and dropped when the data version
+changes.
+"""
+
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SearchResult = Tuple[List[Dict[str, Any]], Dict[str, Any]]
+
+
+class SemanticCache:
+    """Cosine-matched cache of search results for the current data version"""
+
+    def __init__(self, max_entries: int = 500, threshold: float = 0.95):
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}")
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Invalid threshold: {threshold}")
+
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.version: Optional[int] = None
+
+        self._matrix: Optional[np.ndarray] = None  # allocated on first put, once the dimension is known
+        self._key_hashes = np.zeros(max_entries, dtype=np.int64)
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._keys: List[Optional[Hashable]] = [None] * max_entries
+        self._queries: List[Optional[str]] = [None] * max_entries
+        self._values: List[Optional[SearchResult]] = [None] * max_entries
+        self._size = 0
+        self._tick = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._hit_similarity_total = 0.0
+        self.min_hit_similarity: Optional[float] = None
+        self.last_hit_similarity: Optional[float] = None
+
+    def _check_version(self, version: int) -> bool:
+        # Caller holds the lock; False for a version older than the cached one
+        if self.version is not None and version < self.version:
+            return False
+        if version != self.version:
+            if self._size:
+                self.invalidations += 1
+            self._clear()
+            self.version = version
+        return True
+
+    def _clear(self):
+        self._keys = [None] * self.max_entries
+        self._queries = [None] * self.max_entries
+        self._values = [None] * self.max_entries
+        self._size = 0
+
+    @staticmethod
+    def _unit(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def get(self, embedding: Sequence[float], key: Hashable, version: int) -> Optional[Tuple[SearchResult, float, str]]:
+        """Closest cached search for ``key`` above the threshold
+
+        Returns copies of (results, search_stats), the cosine similarity and
+        the cached query text, or None on a miss.
+        """
+        vector = self._unit(embedding)
+        with self._lock:
+            match = None
+            if (self._check_version(version) and self._size and vector is not None
+                    and self._matrix.shape[1] == vector.shape[0]):
+                similarities = self._matrix[:self._size] @ vector
+                similarities[self._key_hashes[:self._size] != hash(key)] = -1.0
+                slot = int(np.argmax(similarities))
+                if similarities[slot] >= self.threshold and self._keys[slot] == key:
+                    match = slot, float(similarities[slot])
+
+            if match is None:
+                self.misses += 1
+                return None
+
+            slot, similarity = match
+            self._tick += 1
+            self._last_used[slot] = self._tick
+            self.hits += 1
+            self._hit_similarity_total += similarity
+            self.last_hit_similarity = similarity
+            if self.min_hit_similarity is None or similarity < self.min_hit_similarity:
+                self.min_hit_similarity = similarity
+            results, search_stats = self._values[slot]
+            query = self._queries[slot]
+        return ([dict(result) for result in results], dict(search_stats)), similarity, query
+
+    def put(self, query: str, embedding: Sequence[float], key: Hashable, version: int,
+            results: List[Dict[str, Any]], search_stats: Dict[str, Any]):
+        """Remember the ranking computed for ``query``; ignored if a newer version was seen meanwhile"""
+        vector = self._unit(embedding)
+        if vector is None:
+            return
+        entry = ([dict(result) for result in results], dict(search_stats))
+        with self._lock:
+            if not self._check_version(version):
+                return
+            if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+                # First entry, or the embedding model changed
+                self._matrix = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+                self._clear()
+
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used))
+                self.evictions += 1
+
+            self._tick += 1
+            self._matrix[slot] = vector
+            self._key_hashes[slot] = hash(key)
+            self._keys[slot] = key
+            self._last_used[slot] = self._tick
+            self._queries[slot] = query
+            self._values[slot] = entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size, hit rate and the similarity of hits, for tuning the threshold"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': self._size,
+                'max_entries': self.max_entries,
+                'threshold': self.threshold,
+                'data_version': self.version,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'mean_hit_similarity': self._hit_similarity_total / self.hits if self.hits else None,
+                'min_hit_similarity': self.min_hit_similarity,
+                'last_hit_similarity': self.last_hit_similarity,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
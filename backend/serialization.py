@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Fast Response Serialization
+- row_mapper: binds a column tuple once and returns a row -> dict function
+- FastJSONResponse: encodes already-shaped payloads with orjson (stdlib
+  json when orjson is not installed), bypassing response_model validation
+  and jsonable_encoder
+"""
+
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any, Callable, Dict, Sequence
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+RowMapper = Callable[[Sequence[Any]], Dict[str, Any]]
+
+
+def row_mapper(columns: Sequence[str], offset: int = 0) -> RowMapper:
+    """Map ``row[offset:]`` onto ``columns``; trailing extra values are ignored"""
+    columns = tuple(columns)
+
+    def map_row(row: Sequence[Any]) -> Dict[str, Any]:
+        return dict(zip(columns, row[offset:]))
+
+    return map_row
+
+
+def _default(value: Any) -> Any:
+    # Decimals stay strings ("150.00"), matching what the pydantic v2
+    # response model produced and what the frontend rate display expects
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response for payloads built from trusted rows; no validation pass"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
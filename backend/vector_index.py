@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+In-Process Vector Index
+Exact cosine search over a contiguous float32 matrix of consultant
+embeddings, used as an optional alternative to the pgvector ivfflat query.
+The whole table is small enough to scan with one matrix-vector product.
+Given a DataVersion, the matrix reloads whenever the data version moves and
+each snapshot records the version it reflects, so callers caching on that
+version can tell when the matrix still trails it.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Columns returned by semantic search, in result order
+RESULT_COLUMNS = (
+    'consultant_id', 'name', 'email', 'phone', 'practice_area', 'location',
+    'consultant_status', 'business_strategy_skills', 'finance_skills',
+    'law_skills', 'marketing_pr_skills', 'nonprofit_skills',
+    'professional_passion', 'projects_excite', 'description', 'keywords',
+    'title', 'hourly_rate_low', 'hourly_rate_high', 'last_activity_time',
+)
+
+_LOAD_SQL = f"""
+    SELECT {', '.join(RESULT_COLUMNS)}, embedding::real[]
+    FROM consultants
+    WHERE embedding IS NOT NULL
+    ORDER BY consultant_id
+"""
+
+# Cheap signature of the table contents, used to detect when a reload is needed
+_SIGNATURE_SQL = "SELECT COUNT(*), MAX(extracted_at), MAX(modified_time) FROM consultants"
+
+
+class _IndexSnapshot:
+    """Immutable arrays for one version of the table; swapped in as a whole on refresh"""
+
+    __slots__ = ("matrix", "active", "rows", "signature", "version", "loaded_at")
+
+    def __init__(self, matrix: np.ndarray, active: np.ndarray, rows: List[Dict[str, Any]], signature: Tuple,
+                 version: Optional[int] = None):
+        self.matrix = matrix
+        self.active = active
+        self.rows = rows
+        self.signature = signature
+        self.version = version
+        self.loaded_at = time.time()
+
+
+def _build_snapshot(records: Sequence[Tuple], signature: Tuple, version: Optional[int] = None) -> _IndexSnapshot:
+    """Turn fetched rows into a normalized float32 matrix plus filter masks"""
+    n_columns = len(RESULT_COLUMNS)
+    rows = [dict(zip(RESULT_COLUMNS, record[:n_columns])) for record in records]
+
+    if records:
+        matrix = np.ascontiguousarray([record[n_columns] for record in records], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+    else:
+        matrix = np.zeros((0, 0), dtype=np.float32)
+
+    active = np.fromiter(
+        (row['consultant_status'] == 'Active' for row in rows), dtype=bool, count=len(rows)
+    )
+    return _IndexSnapshot(matrix, active, rows, signature, version)
+
+
+class VectorIndex:
+    """Exact top-k cosine search over consultant embeddings held in memory"""
+
+    def __init__(self, pool, data_version=None):
+        self.pool = pool
+        self.data_version = data_version
+        self._snapshot: Optional[_IndexSnapshot] = None
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def version(self) -> Optional[int]:
+        """Data version the loaded matrix reflects (None without a DataVersion)"""
+        snapshot = self._snapshot
+        return snapshot.version if snapshot is not None else None
+
+    async def _fetch_signature(self) -> Tuple:
+        if self.data_version is not None:
+            # Read before the load: a write landing mid-load leaves this
+            # snapshot on the older version, and the next poll reloads it
+            return (await self.data_version.current(),)
+        async with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            await cursor.execute(_SIGNATURE_SQL)
+            row = await cursor.fetchone()
+            await cursor.close()
+        return tuple(row)
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Reload the matrix if the table changed; readers keep the old snapshot until the swap"""
+        async with self._refresh_lock:
+            signature = await self._fetch_signature()
+            if not force and self._snapshot is not None and self._snapshot.signature == signature:
+                return False
+
+            start_time = time.time()
+            async with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                await cursor.execute(_LOAD_SQL)
+                records = await cursor.fetchall()
+                await cursor.close()
+
+            version = signature[0] if self.data_version is not None else None
+            snapshot = await asyncio.to_thread(_build_snapshot, records, signature, version)
+            self._snapshot = snapshot
+            logger.info(
+                f"🧠 Vector index loaded {len(snapshot.rows)} consultants "
+                f"in {time.time() - start_time:.2f}s"
+            )
+            return True
+
+    async def run_refresh_loop(self, interval: float):
+        """Poll for data changes and refresh in the background"""
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error refreshing vector index: {e}")
+            await asyncio.sleep(interval)
+
+    def search(
+        self,
+        query_embedding: List[float],
+        limit: int = 10,
+        min_similarity: float = 0.7,
+        filter_active: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Exact top-k by cosine similarity with threshold/status filters applied as masks"""
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.rows or limit <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        scores = snapshot.matrix @ (query / norm)
+
+        mask = scores >= min_similarity
+        if filter_active:
+            mask &= snapshot.active
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+
+        if candidates.size > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        results = []
+        for i in candidates:
+            consultant = dict(snapshot.rows[i])
+            consultant['similarity_score'] = float(scores[i])
+            results.append(consultant)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {'loaded': False}
+        return {
+            'loaded': True,
+            'consultants': len(snapshot.rows),
+            'dimensions': int(snapshot.matrix.shape[1]) if snapshot.matrix.ndim == 2 else 0,
+            'matrix_bytes': int(snapshot.matrix.nbytes),
+            'loaded_at': snapshot.loaded_at,
+        }
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Quantized Vector Candidate Retrieval
+First-pass ANN search over a compact copy of consultants.embedding, then an
+exact re-score of the top candidates against the full-precision column:
+- none: HNSW/ivfflat on the float32 column (4 bytes per dimension)
+- halfvec: HNSW on embedding::halfvec (2 bytes per dimension)
+- binary: HNSW on binary_quantize(embedding) with Hamming distance (1 bit
+  per dimension), so the first pass needs rerank_factor more candidates
+The expression indexes are built by etl/check_schema.py (pgvector >= 0.7).
+"""
+
+from typing import Optional, Tuple
+
+QUANTIZATION_MODES = ("none", "halfvec", "binary")
+
+_EXACT_SQL = """
+    SELECT consultant_id, consultant_status, embedding <=> %s::vector AS distance
+    FROM consultants
+    WHERE embedding IS NOT NULL
+    ORDER BY distance
+    LIMIT %s
+"""
+
+# Compact index for the inner ORDER BY, full vectors only for its LIMIT rows
+_RERANK_SQL = """
+    SELECT consultant_id, consultant_status, embedding <=> %s::vector AS distance
+    FROM (
+        SELECT consultant_id, consultant_status, embedding
+        FROM consultants
+        WHERE embedding IS NOT NULL
+        ORDER BY {first_pass_distance}
+        LIMIT %s
+    ) candidates
+    ORDER BY distance
+    LIMIT %s
+"""
+
+_FIRST_PASS_DISTANCE = {
+    "halfvec": "embedding::halfvec({dimensions}) <=> %s::halfvec({dimensions})",
+    "binary": "binary_quantize(embedding)::bit({dimensions}) <~> binary_quantize(%s::vector)",
+}
+
+# Index expressions matching _FIRST_PASS_DISTANCE, so the planner can use them
+INDEX_EXPRESSIONS = {
+    "halfvec": "(embedding::halfvec({dimensions})) halfvec_cosine_ops",
+    "binary": "(binary_quantize(embedding)::bit({dimensions})) bit_hamming_ops",
+}
+
+
+def validate_mode(mode: str) -> str:
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"Invalid vector quantization: {mode} (expected one of {', '.join(QUANTIZATION_MODES)})")
+    return mode
+
+
+def candidates_sql(mode: str, dimensions: int) -> str:
+    """Candidate query returning (consultant_id, consultant_status, exact cosine distance)"""
+    if validate_mode(mode) == "none":
+        return _EXACT_SQL
+    first_pass_distance = _FIRST_PASS_DISTANCE[mode].format(dimensions=int(dimensions))
+    return _RERANK_SQL.format(first_pass_distance=first_pass_distance)
+
+
+def first_pass_limit(mode: str, limit: int, rerank_factor: int, max_limit: Optional[int] = None) -> int:
+    """Rows the index scan must return, at most ``max_limit``
+
+    hnsw.ef_search has to cover this, so callers pass its ceiling (1000);
+    the quantized modes then re-score fewer than limit * rerank_factor rows.
+    """
+    first_pass = limit if mode == "none" else limit * rerank_factor
+    return min(first_pass, max_limit) if max_limit else first_pass
+
+
+def candidates_params(mode: str, embedding_str: str, limit: int, rerank_factor: int,
+                      max_limit: Optional[int] = None) -> Tuple:
+    first_pass = first_pass_limit(mode, limit, rerank_factor, max_limit)
+    if mode == "none":
+        return (embedding_str, first_pass)
+    return (embedding_str, embedding_str, first_pass, min(limit, first_pass))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Versioned LRU Cache
+Bounded in-process LRU valid for a single data version: the first lookup
+or store under a newer version drops everything cached under the old one.
+Lookups and stores for an older version (a request that read the version
+before a sync landed) are ignored, so the cache never moves backwards.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class VersionedLRUCache:
+    """LRU of values for the current data version; subclasses add typed get/put"""
+
+    def __init__(self, max_entries: int):
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}")
+
+        self.max_entries = max_entries
+        self.version: Optional[int] = None
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self, version: int) -> bool:
+        # Caller holds the lock; False for a version older than the cached one
+        if self.version is not None and version < self.version:
+            return False
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.version = version
+        return True
+
+    def lookup(self, key: Hashable, version: int) -> Optional[Any]:
+        """The stored value, or None on a miss or stale version"""
+        with self._lock:
+            value = self._entries.get(key) if self._check_version(version) else None
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def store(self, key: Hashable, version: int, value: Any):
+        """Store a value computed against ``version``; ignored if a newer version was seen meanwhile"""
+        with self._lock:
+            if not self._check_version(version):
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'data_version': self.version,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
@@ -64,8 +64,8 @@ class ConsultantAPI {
     return response.json();
   }
 
-  async getConsultant(consultantId: string): Promise<Consultant> {
-    const response = await fetch(`${this.baseURL}/consultant/${consultantId}`);
+  async getConsultant(consultantId: string, fields: string = 'card'): Promise<Consultant> {
+    const response = await fetch(`${this.baseURL}/consultant/${consultantId}?fields=${encodeURIComponent(fields)}`);
 
     if (!response.ok) {
       throw new Error(`Failed to get consultant: ${response.statusText}`);
@@ -74,13 +74,16 @@ class ConsultantAPI {
     return response.json();
   }
 
-  async getAllConsultants(limit: number = 50, offset: number = 0): Promise<{
+  async getAllConsultants(limit: number = 50, offset: number = 0, cursor?: string): Promise<{
     consultants: Consultant[];
     limit: number;
     offset: number;
+    next_cursor: string | null;
+    prev_cursor: string | null;
     total: number;
   }> {
-    const response = await fetch(`${this.baseURL}/consultants?limit=${limit}&offset=${offset}`);
+    const page = cursor ? `cursor=${encodeURIComponent(cursor)}` : `offset=${offset}`;
+    const response = await fetch(`${this.baseURL}/consultants?limit=${limit}&${page}`);
 
     if (!response.ok) {
       throw new Error(`Failed to get consultants: ${response.statusText}`);
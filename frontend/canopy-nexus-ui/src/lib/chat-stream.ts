@@ -32,6 +32,42 @@ const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 console.log('API_BASE_URL:', API_BASE_URL);
 console.log('Environment:', import.meta.env);
 
+function toChatConsultant(c: any): Consultant {
+  return {
+    id: c.consultant_id,
+    name: c.name,
+    email: c.email,
+    title: c.title || '',
+    location: c.location || '',
+    phone: c.phone || '',
+    practice_area: c.practice_area || '',
+    consultant_status: c.consultant_status || 'Unknown',
+    business_strategy_skills: c.business_strategy_skills || '',
+    finance_skills: c.finance_skills || '',
+    law_skills: c.law_skills || '',
+    marketing_pr_skills: c.marketing_pr_skills || '',
+    nonprofit_skills: c.nonprofit_skills || '',
+    professional_passion: c.professional_passion || '',
+    projects_excite: c.projects_excite || '',
+    description: c.description || '',
+    keywords: c.keywords || '',
+    hourly_rate_low: c.hourly_rate_low || '',
+    hourly_rate_high: c.hourly_rate_high || '',
+    rate: c.hourly_rate_low ? `$${c.hourly_rate_low}-${c.hourly_rate_high}/hr` : 'Rate not specified',
+    similarity: c.similarity_score || 0,
+    // Combine all skills for display
+    skills: [
+      c.business_strategy_skills,
+      c.finance_skills,
+      c.law_skills,
+      c.marketing_pr_skills,
+      c.nonprofit_skills
+    ].filter(Boolean).join(', '),
+    experience: c.professional_passion || '',
+    availability: c.consultant_status || 'Unknown'
+  };
+}
+
 export async function streamChat({
   messages,
   onDelta,
@@ -184,39 +220,7 @@ export async function streamChat({
     }
 
       const searchData = await searchResponse.json();
-      const consultants: Consultant[] = searchData.consultants.map((c: any) => ({
-        id: c.consultant_id,
-        name: c.name,
-        email: c.email,
-        title: c.title || '',
-        location: c.location || '',
-        phone: c.phone || '',
-        practice_area: c.practice_area || '',
-        consultant_status: c.consultant_status || 'Unknown',
-        business_strategy_skills: c.business_strategy_skills || '',
-        finance_skills: c.finance_skills || '',
-        law_skills: c.law_skills || '',
-        marketing_pr_skills: c.marketing_pr_skills || '',
-        nonprofit_skills: c.nonprofit_skills || '',
-        professional_passion: c.professional_passion || '',
-        projects_excite: c.projects_excite || '',
-        description: c.description || '',
-        keywords: c.keywords || '',
-        hourly_rate_low: c.hourly_rate_low || '',
-        hourly_rate_high: c.hourly_rate_high || '',
-        rate: c.hourly_rate_low ? `$${c.hourly_rate_low}-${c.hourly_rate_high}/hr` : 'Rate not specified',
-        similarity: c.similarity_score || 0,
-        // Combine all skills for display
-        skills: [
-          c.business_strategy_skills,
-          c.finance_skills,
-          c.law_skills,
-          c.marketing_pr_skills,
-          c.nonprofit_skills
-        ].filter(Boolean).join(', '),
-        experience: c.professional_passion || '',
-        availability: c.consultant_status || 'Unknown'
-      }));
+      const consultants: Consultant[] = searchData.consultants.map(toChatConsultant);
 
       // Generate consultant-focused response
       const responseText = `I found ${consultants.length} consultants matching your criteria: "${lastUserMessage.content}". Here are the top matches:`;